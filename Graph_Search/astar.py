@@ -0,0 +1,156 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from array import array
+import random
+import struct
+from graph_base import Graph
+from graph_snapshot import _decode_labels, _encode_labels, _pack_sections, _unpack_sections
+from dijkstra import dijkstra, _search_to_target, INF
+from common_utils import sample_symmetric_graph, sample_directed_graph_general
+
+Heuristic = Callable[[Any], float]
+
+def astar(graph: Graph, source: Any, target: Any, heuristic: Optional[Heuristic] = None) -> Tuple[float, List[Any]]:
+    """
+    A* search from source to target. heuristic(v) must not overestimate d(v, target);
+    without one this is the early-exit Dijkstra (dijkstra._search_to_target, which also
+    skips nodes the heuristic rates at inf). Returns (distance, path) or (inf, []).
+    """
+    return _search_to_target(lambda u: graph.neighbors(u).items(), source, target, heuristic)
+
+class ALTLandmarks:
+    """
+    ALT preprocessing (A*, landmarks, triangle inequality).
+    Stores d(L, v) and, for directed graphs, d(v, L) for each landmark L as flat
+    float arrays indexed by node position, and derives admissible lower bounds.
+    """
+    def __init__(self, nodes: List[Any], landmarks: List[Any], directed: bool,
+                 forward: List[array], backward: Optional[List[array]] = None) -> None:
+        self.nodes = nodes
+        self.landmarks = landmarks
+        self.directed = directed
+        self._index: Dict[Any, int] = {u: i for i, u in enumerate(nodes)}
+        self._fwd = forward
+        self._bwd = backward if backward is not None else forward
+
+    @classmethod
+    def build(cls, graph: Graph, k: int = 8, seed: Optional[int] = None) -> "ALTLandmarks":
+        """Pick k landmarks by farthest-point selection and run dijkstra from each."""
+        nodes = graph.nodes()
+        if not nodes:
+            return cls([], [], graph.directed, [])
+        rev = graph.reverse() if graph.directed else None  # view over predecessors(), no copy
+        rng = random.Random(seed)
+        landmarks: List[Any] = []
+        forward: List[array] = []
+        backward: List[array] = []
+        closest: Dict[Any, float] = {u: INF for u in nodes}
+        current = rng.choice(nodes)
+        while len(landmarks) < min(k, len(nodes)):
+            landmarks.append(current)
+            d = dijkstra(graph, current)[0]
+            forward.append(array("d", (d[u] for u in nodes)))
+            if rev is not None:
+                r = dijkstra(rev, current)[0]
+                backward.append(array("d", (r[u] for u in nodes)))
+            for u in nodes:
+                if d[u] < closest[u]: closest[u] = d[u]
+            # Farthest-point selection; nodes the landmarks cannot reach come first.
+            candidates = [u for u in nodes if u not in landmarks]
+            if not candidates:
+                break
+            current = max(candidates, key=lambda u: closest[u])
+        return cls(nodes, landmarks, graph.directed, forward, backward if rev is not None else None)
+
+    def lower_bound(self, v: Any, t: Any) -> float:
+        i, j = self._index.get(v), self._index.get(t)
+        if i is None or j is None:
+            return 0.0
+        best = 0.0
+        for F, B in zip(self._fwd, self._bwd):
+            lv, lt = F[i], F[j]
+            if lv != INF and lt != INF and lt - lv > best:
+                best = lt - lv
+            vl, tl = B[i], B[j]
+            if vl != INF and tl != INF and vl - tl > best:
+                best = vl - tl
+        return best
+
+    def heuristic(self, target: Any) -> Heuristic:
+        j = self._index.get(target)
+        if j is None:
+            return lambda v: 0.0
+        index = self._index
+        rows = [(F, F[j], B, B[j]) for F, B in zip(self._fwd, self._bwd)]
+        def h(v: Any) -> float:
+            i = index.get(v)
+            if i is None:
+                return 0.0
+            best = 0.0
+            for F, lt, B, tl in rows:
+                lv, vl = F[i], B[i]
+                if lv != INF and lt != INF and lt - lv > best:
+                    best = lt - lv
+                if vl != INF and tl != INF and vl - tl > best:
+                    best = vl - tl
+            return best
+        return h
+
+    def shortest_path(self, graph: Graph, source: Any, target: Any) -> Tuple[float, List[Any]]:
+        return astar(graph, source, target, self.heuristic(target))
+
+    # File: header (magic, version, directed, n, k), then length-prefixed sections holding
+    # the node label table (int or str labels), landmark positions int64[k] and the float64
+    # distance tables. Nothing is unpickled, so loading an untrusted file runs no code.
+    _MAGIC = b"GRAPHALT"
+    _HEADER = struct.Struct("<8sHBxqq")
+
+    def save(self, path: str) -> None:
+        n, k = len(self.nodes), len(self.landmarks)
+        sections = [_encode_labels(self.nodes), array("q", (self._index[x] for x in self.landmarks)).tobytes(),
+                    b"".join(a.tobytes() for a in self._fwd),
+                    b"".join(a.tobytes() for a in self._bwd) if self._bwd is not self._fwd else b""]
+        with open(path, "wb") as f:
+            f.write(self._HEADER.pack(self._MAGIC, 2, self.directed, n, k) + _pack_sections(sections))
+
+    @classmethod
+    def load(cls, path: str) -> "ALTLandmarks":
+        with open(path, "rb") as f:
+            data = memoryview(f.read())
+        if len(data) < cls._HEADER.size:
+            raise ValueError("Not a landmark table.")
+        magic, version, directed, n, k = cls._HEADER.unpack_from(data)
+        if magic != cls._MAGIC:
+            raise ValueError("Not a landmark table.")
+        if version != 2:
+            raise ValueError("Unsupported landmark table version.")
+        raw_nodes, raw_lm, raw_fwd, raw_bwd = _unpack_sections(data, cls._HEADER.size, 4)
+        if len(raw_lm) != 8 * k or len(raw_fwd) != 8 * k * n or len(raw_bwd) not in (0, 8 * k * n):
+            raise ValueError("Landmark table sections do not match its header.")
+        nodes = _decode_labels(raw_nodes, n)
+        positions = raw_lm.cast("q").tolist()
+        if any(not 0 <= i < n for i in positions):
+            raise ValueError("Landmark index out of range.")
+        def tables(raw: memoryview) -> Optional[List[array]]:
+            if not len(raw):
+                return None
+            flat = raw.cast("d")
+            return [array("d", flat[i * n:(i + 1) * n]) for i in range(k)]
+        return cls(nodes, [nodes[i] for i in positions], bool(directed), tables(raw_fwd) or [], tables(raw_bwd))
+
+def main():
+    print("=== A* (zero heuristic) on symmetric graph ===")
+    g = sample_symmetric_graph()
+    print(astar(g, "A", "Z"))
+
+    print("=== ALT on symmetric graph ===")
+    alt = ALTLandmarks.build(g, k=2, seed=0)
+    print("landmarks:", alt.landmarks, "bound A->Z:", alt.lower_bound("A", "Z"))
+    print(alt.shortest_path(g, "A", "Z"))
+
+    print("=== ALT on directed graph ===")
+    d = sample_directed_graph_general()
+    alt = ALTLandmarks.build(d, k=2, seed=0)
+    print(alt.shortest_path(d, "B", "D"), alt.shortest_path(d, "D", "A"))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from collections import deque
+from graph_base import Graph
+from common_utils import sample_symmetric_graph, sample_directed_graph_general
+
+INF = float("inf")
+
+class NegativeCycleError(ValueError):
+    """Raised when a negative-weight cycle is reachable; .cycle is a witness [c0, c1, ..., c0]."""
+    def __init__(self, cycle: List[Any]) -> None:
+        super().__init__(f"Negative-weight cycle: {cycle}")
+        self.cycle = cycle
+
+def _parent_cycle(parent: Dict[Any, Optional[Any]], starts: Iterable[Any]) -> Optional[List[Any]]:
+    # Any cycle in the parent pointers is a negative cycle; return it in edge order.
+    done: set = set()
+    for start in starts:
+        trail: Dict[Any, int] = {}
+        walk: List[Any] = []
+        x = start
+        while x is not None and x not in done and x not in trail:
+            trail[x] = len(walk); walk.append(x); x = parent.get(x)
+        done.update(walk)
+        if x is not None and x in trail:
+            cycle = walk[trail[x]:]
+            cycle.reverse()
+            return cycle + [cycle[0]]
+    return None
+
+def _bellman_ford(graph: Graph, sources: Iterable[Any]) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    nodes = graph.nodes()
+    dist: Dict[Any, float] = {u: INF for u in nodes}
+    parent: Dict[Any, Optional[Any]] = {u: None for u in nodes}
+    for s in sources: dist[s] = 0.0
+    for _ in range(len(nodes)):
+        changed = None
+        for u in nodes:
+            du = dist[u]
+            if du == INF:
+                continue
+            for v, w in graph.neighbors(u).items():
+                if du + w < dist[v]:
+                    dist[v] = du + w; parent[v] = u; changed = v
+        if changed is None:
+            return dist, parent
+    # Still relaxing after |V| passes: the parent graph now holds a negative cycle.
+    cycle = _parent_cycle(parent, [changed] + nodes)
+    raise NegativeCycleError(cycle or [changed, changed])
+
+def _spfa(graph: Graph, sources: Iterable[Any]) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    nodes = graph.nodes()
+    n = len(nodes)
+    dist: Dict[Any, float] = {u: INF for u in nodes}
+    parent: Dict[Any, Optional[Any]] = {u: None for u in nodes}
+    hops: Dict[Any, int] = {u: 0 for u in nodes}
+    sources = list(sources)
+    q = deque()
+    queued = set()
+    for s in sources:
+        dist[s] = 0.0; q.append(s); queued.add(s)
+    while q:
+        u = q.popleft(); queued.discard(u)
+        du = dist[u]
+        for v, w in graph.neighbors(u).items():
+            if du + w < dist[v]:
+                dist[v] = du + w; parent[v] = u; hops[v] = hops[u] + 1
+                if hops[v] >= n:
+                    cycle = _parent_cycle(parent, [v] + nodes)
+                    if cycle is None:
+                        return _bellman_ford(graph, sources)
+                    raise NegativeCycleError(cycle)
+                if v not in queued:
+                    q.append(v); queued.add(v)
+    return dist, parent
+
+def bellman_ford(graph: Graph, source: Any) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """Bellman–Ford with early exit once a full pass relaxes nothing."""
+    return _bellman_ford(graph, [source])
+
+def spfa(graph: Graph, source: Any) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """Queue-based Bellman–Ford (SPFA): only nodes whose distance changed are rescanned."""
+    return _spfa(graph, [source])
+
+def main():
+    print("=== Bellman–Ford on symmetric graph ===")
+    g = sample_symmetric_graph()
+    print(bellman_ford(g, "A")[0])
+
+    print("=== SPFA on directed graph with a rebate edge ===")
+    d = sample_directed_graph_general()
+    d.add_edge("B", "D", -4)
+    print(spfa(d, "A")[0])
+
+    print("=== Negative cycle witness ===")
+    d.add_edge("D", "A", -2)
+    try:
+        spfa(d, "A")
+    except NegativeCycleError as e:
+        print("cycle:", e.cycle)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from graph_base import Graph
+from graph_generators import graph_for_edges
+from bfs import bfs, bfs_direction_optimizing
+from dfs import dfs
+from dijkstra import dijkstra
+from floyd_warshall import floyd_warshall
+from prim import prim_mst
+from kruskal import kruskal_mst
+from toposort_kahn import toposort_kahn
+from toposort_dfs import toposort_dfs
+from connected_components import connected_components
+
+FAMILIES = ("er", "ba", "grid", "dag", "complete")
+
+# name -> (run(graph, source), graph kind it needs: "any" / "undirected" / "dag", max nodes or None)
+ALGORITHMS: Dict[str, Tuple[Callable[[Graph, Any], Any], str, Optional[int]]] = {
+    "bfs": (bfs, "any", None),
+    # Same level-synchronous BFS with and without the bottom-up switch (the CSR is cached on the graph).
+    "bfs_direction_optimizing": (bfs_direction_optimizing, "any", None),
+    "bfs_top_down": (lambda g, s: bfs_direction_optimizing(g, s, alpha=float("inf")), "any", None),
+    "dfs": (dfs, "any", None),
+    "dijkstra": (dijkstra, "any", None),
+    "floyd_warshall": (lambda g, s: floyd_warshall(g), "any", 400),  # O(V^3) in pure Python
+    "prim_mst": (lambda g, s: prim_mst(g), "undirected", None),
+    "kruskal_mst": (lambda g, s: kruskal_mst(g), "undirected", None),
+    "toposort_kahn": (lambda g, s: toposort_kahn(g), "dag", None),
+    "toposort_dfs": (lambda g, s: toposort_dfs(g), "dag", None),
+    "connected_components": (lambda g, s: connected_components(g), "any", None),
+}
+
+def _applies(kind: str, graph: Graph) -> bool:
+    return kind == "any" or (kind == "dag") == graph.directed
+
+def _time(fn: Callable[[], Any], repeat: int) -> List[float]:
+    out = []
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter(); fn(); out.append(time.perf_counter() - t0)
+    return out
+
+def _peak_bytes(fn: Callable[[], Any]) -> int:
+    # Separate run: tracemalloc slows allocation-heavy code, so it never overlaps the timings.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def run(families: List[str], scales: List[int], algorithms: List[str], repeat: int = 3,
+        seed: int = 0, memory: bool = True, log: Callable[[str], None] = print) -> Dict[str, Any]:
+    """Benchmark every applicable (family, 10**scale edges, algorithm) combination."""
+    results: List[Dict[str, Any]] = []
+    for family in families:
+        for scale in scales:
+            t0 = time.perf_counter()
+            g = graph_for_edges(family, 10 ** scale, seed=seed)
+            build = time.perf_counter() - t0
+            n, m = len(g.nodes()), len(g.edges())
+            log(f"{family} 1e{scale}: |V|={n} |E|={m} built in {build:.2f}s")
+            source = max(g.nodes(), key=lambda u, g=g: len(g.neighbors(u)))  # never a dead-end start
+            for name in algorithms:
+                fn, kind, max_nodes = ALGORITHMS[name]
+                row: Dict[str, Any] = {"family": family, "scale": scale, "nodes": n, "edges": m,
+                                       "algorithm": name, "build_seconds": build}
+                if not _applies(kind, g):
+                    continue
+                if max_nodes is not None and n > max_nodes:
+                    row["skipped"] = f"|V| > {max_nodes}"
+                    results.append(row)
+                    continue
+                call = lambda fn=fn, g=g, source=source: fn(g, source)
+                times = _time(call, repeat)
+                row.update(times=times, best=min(times), median=statistics.median(times))
+                if memory:
+                    row["peak_bytes"] = _peak_bytes(call)
+                log(f"  {name:<26} best {row['best']:.4f}s" +
+                    (f"  peak {row['peak_bytes'] / 2**20:.1f} MiB" if memory else ""))
+                results.append(row)
+            del g
+    return {"meta": {"python": sys.version.split()[0], "platform": platform.platform(),
+                     "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "repeat": repeat, "seed": seed},
+            "results": results}
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], threshold: float = 0.10, min_seconds: float = 1e-3,
+            log: Callable[[str], None] = print) -> List[Tuple[str, int, str, float]]:
+    """
+    Best-time ratios new/old per (family, scale, algorithm); returns the rows slower than
+    1 + threshold. Rows where both runs took under min_seconds are timer noise and never flagged.
+    """
+    key = lambda r: (r["family"], r["scale"], r["algorithm"])
+    before = {key(r): r for r in old["results"] if "best" in r}
+    regressions = []
+    for r in new["results"]:
+        prev = before.get(key(r))
+        if prev is None or "best" not in r:
+            continue
+        ratio = r["best"] / prev["best"] if prev["best"] > 0 else float("inf")
+        flag = "REGRESSION" if ratio > 1 + threshold else ("faster" if ratio < 1 - threshold else "")
+        if max(r["best"], prev["best"]) < min_seconds:
+            flag = ""
+        log(f"{r['family']:<9} 1e{r['scale']:<3} {r['algorithm']:<26} {prev['best']:.4f}s -> {r['best']:.4f}s  x{ratio:.2f} {flag}")
+        if flag == "REGRESSION":
+            regressions.append((*key(r), ratio))
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Benchmark Graph_Search algorithms on seeded synthetic graphs.")
+    sub = p.add_subparsers(dest="command")
+    r = sub.add_parser("run", help="run the benchmarks and write JSON results")
+    r.add_argument("--families", nargs="+", choices=FAMILIES, default=list(FAMILIES))
+    r.add_argument("--scales", nargs="+", type=int, default=[3, 4], help="edge counts as powers of ten (3..7)")
+    r.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    r.add_argument("--repeat", type=int, default=3)
+    r.add_argument("--seed", type=int, default=0)
+    r.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory run")
+    r.add_argument("--out", help="write the JSON results here (otherwise only the log is printed)")
+    c = sub.add_parser("compare", help="compare two result files; exits 1 on regressions")
+    c.add_argument("old"); c.add_argument("new")
+    c.add_argument("--threshold", type=float, default=0.10)
+    c.add_argument("--min-seconds", type=float, default=1e-3, help="ignore rows faster than this in both runs")
+    args = p.parse_args(argv)
+    if args.command == "compare":
+        with open(args.old) as f_old, open(args.new) as f_new:
+            regressions = compare(json.load(f_old), json.load(f_new), args.threshold, args.min_seconds)
+        print(f"{len(regressions)} regression(s)")
+        return 1 if regressions else 0
+    if args.command is None:  # quick smoke run, like the other modules' demos
+        args = p.parse_args(["run", "--scales", "3", "--repeat", "1"])
+    out = run(args.families, args.scales, args.algorithms, args.repeat, args.seed, not args.no_memory)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(out, f, indent=2)
+        print(f"wrote {len(out['results'])} results to {args.out}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,13 @@
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from collections import deque
-from graph_base import Graph
+from graph_base import Graph, CSRGraph
 from common_utils import sample_symmetric_graph, sample_directed_graph_general
 
+try:
+    import numpy as np
+except ImportError:  # only the level-synchronous variant needs NumPy
+    np = None
+
 def bfs(graph: Graph, source: Any) -> Tuple[List[Any], Dict[Any, Optional[Any]], Dict[Any, int]]:
     visited: Set[Any] = set([source])
     parent: Dict[Any, Optional[Any]] = {source: None}
@@ -17,6 +22,87 @@ def bfs(graph: Graph, source: Any) -> Tuple[List[Any], Dict[Any, Optional[Any]],
                 visited.add(v); parent[v] = u; dist[v] = dist[u] + 1; q.append(v)
     return order, parent, dist
 
+def _gather(indptr, indices, rows):
+    # Concatenated adjacency of `rows` plus the row each entry came from.
+    starts, ends = indptr[rows], indptr[rows + 1]
+    lengths = ends - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return indices[:0], rows[:0]
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return indices[np.arange(total) + offsets], np.repeat(rows, lengths)
+
+def _bottom_up_step(rindptr, rindices, in_frontier, candidates, tail: int = 1024):
+    """
+    Unvisited candidates with an in-neighbour in the frontier. Round k probes every
+    still-open candidate's k-th in-neighbour and drops it once a parent is found (or its
+    in-edges run out), so a vertex stops scanning at its first frontier parent. When few
+    candidates remain, their unprobed in-edges are gathered in one pass instead.
+    """
+    start = rindptr[candidates]
+    left = rindptr[candidates + 1] - start
+    open_ = left > 0
+    candidates, start, left = candidates[open_], start[open_], left[open_]
+    found = []
+    k = 0
+    while candidates.size > tail:
+        hit = in_frontier[rindices[start + k]]
+        found.append(candidates[hit])
+        k += 1
+        keep = ~hit & (left > k)
+        candidates, start, left = candidates[keep], start[keep], left[keep]
+    if candidates.size:
+        lengths = left - k
+        arcs = np.arange(int(lengths.sum())) + np.repeat(start + k - np.cumsum(lengths) + lengths, lengths)
+        owners = np.repeat(candidates, lengths)
+        found.append(np.unique(owners[in_frontier[rindices[arcs]]]))
+    return np.concatenate(found) if found else candidates
+
+def bfs_direction_optimizing(graph: Union[Graph, CSRGraph], source: Any, alpha: float = 15.0, beta: float = 18.0):
+    """
+    Level-synchronous BFS over the CSR form with NumPy boolean frontier/visited maps.
+    Each level expands top-down (frontier -> out-edges) or bottom-up (unvisited nodes
+    look for a parent in the frontier over in-edges), chosen by Beamer's heuristic:
+    go bottom-up when frontier edges > unexplored edges / alpha, and back when the
+    frontier shrinks below |V| / beta. Returns an int32 array of hop distances indexed
+    by node id (graph.nodes() order), with -1 for unreachable nodes. A Graph is
+    converted with graph.to_csr(), which is cached until the graph changes; pass a
+    CSRGraph to skip the conversion entirely.
+    """
+    if np is None:
+        raise ImportError("bfs_direction_optimizing requires NumPy.")
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    n = csr.num_nodes
+    indptr, indices, _ = csr.to_numpy()
+    rindptr, rindices, _ = csr.to_numpy(reverse=True) if csr.directed else (indptr, indices, None)
+    out_deg = np.diff(indptr)
+    dist = np.full(n, -1, dtype=np.int32)
+    visited = np.zeros(n, dtype=bool)
+    s = csr.index_of(source)
+    visited[s] = True; dist[s] = 0
+    frontier = np.array([s], dtype=np.int64)
+    unexplored = int(out_deg.sum()) - int(out_deg[s])
+    bottom_up = False
+    level = 0
+    while frontier.size:
+        frontier_edges = int(out_deg[frontier].sum())
+        if not bottom_up and frontier_edges > unexplored / alpha:
+            bottom_up = True
+        elif bottom_up and frontier.size < n / beta:
+            bottom_up = False
+        if bottom_up:
+            in_frontier = np.zeros(n, dtype=bool)
+            in_frontier[frontier] = True
+            nxt = _bottom_up_step(rindptr, rindices, in_frontier, np.flatnonzero(~visited))
+        else:
+            nbrs, _ = _gather(indptr, indices, frontier)
+            nxt = np.unique(nbrs[~visited[nbrs]])
+        level += 1
+        visited[nxt] = True; dist[nxt] = level
+        unexplored -= int(out_deg[nxt].sum())
+        frontier = nxt.astype(np.int64, copy=False)
+    return dist
+
 def main():
     print("=== BFS on symmetric graph ===")
     g = sample_symmetric_graph()
@@ -26,5 +112,11 @@ def main():
     d = sample_directed_graph_general()
     print(bfs(d, "A")[0])
 
+    if np is None:
+        return
+    print("=== Direction-optimizing BFS distances (graph.nodes() order) ===")
+    print(g.nodes(), bfs_direction_optimizing(g, "A"))
+    print(d.nodes(), bfs_direction_optimizing(d, "A"))
+
 if __name__ == "__main__":
     main()
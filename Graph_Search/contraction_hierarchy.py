@@ -0,0 +1,229 @@
+from typing import Any, Dict, List, Optional, Tuple
+import heapq
+import struct
+from array import array
+from graph_base import Graph
+from graph_snapshot import _decode_labels, _encode_labels, _pack_sections, _unpack_sections
+from common_utils import sample_symmetric_graph, sample_directed_graph_general
+
+INF = float("inf")
+
+# Edge payload: (weight, middle node of the shortcut or None for an original edge).
+Arc = Tuple[float, Optional[Any]]
+
+class ContractionHierarchy:
+    """
+    Contraction hierarchy over a static Graph.
+    Nodes are contracted in importance order (edge difference + deleted neighbors,
+    lazily updated); shortcuts keep their middle node so paths can be unpacked.
+    Queries run a bidirectional Dijkstra that only climbs in rank on both sides,
+    with stall-on-demand pruning.
+    """
+    def __init__(self, rank: Dict[Any, int], up: Dict[Any, Dict[Any, Arc]], down: Dict[Any, Dict[Any, Arc]]) -> None:
+        self.rank = rank
+        self._up = up      # u -> {v: arc u->v} with rank[v] > rank[u]
+        self._down = down  # v -> {u: arc u->v} with rank[u] > rank[v]
+
+    @classmethod
+    def build(cls, graph: Graph, settle_limit: int = 64) -> "ContractionHierarchy":
+        out: Dict[Any, Dict[Any, Arc]] = {u: {} for u in graph.nodes()}
+        inn: Dict[Any, Dict[Any, Arc]] = {u: {} for u in graph.nodes()}
+        for u in graph.nodes():
+            for v, w in graph.neighbors(u).items():
+                if w < 0:
+                    raise ValueError("Contraction hierarchies require non-negative weights.")
+                if u != v and w < out[u].get(v, (INF, None))[0]:
+                    out[u][v] = (w, None); inn[v][u] = (w, None)
+        deleted: Dict[Any, int] = {u: 0 for u in out}
+
+        def shortcuts(v: Any) -> List[Tuple[Any, Any, float]]:
+            needed: List[Tuple[Any, Any, float]] = []
+            if not inn[v] or not out[v]:
+                return needed
+            max_out = max(w for w, _ in out[v].values())
+            for u, (w1, _) in inn[v].items():
+                targets = {x: w1 + w2 for x, (w2, _) in out[v].items() if x != u}
+                if not targets:
+                    continue
+                limit = w1 + max_out
+                dist = {u: 0.0}
+                pq = [(0.0, u)]
+                settled = 0
+                while pq and settled < settle_limit:
+                    du, a = heapq.heappop(pq)
+                    if du > dist[a]:
+                        continue
+                    if du > limit:
+                        break
+                    settled += 1
+                    for b, (w, _) in out[a].items():
+                        if b == v:
+                            continue
+                        alt = du + w
+                        if alt < dist.get(b, INF):
+                            dist[b] = alt; heapq.heappush(pq, (alt, b))
+                for x, via in targets.items():
+                    if dist.get(x, INF) > via:
+                        needed.append((u, x, via))
+            return needed
+
+        def priority(v: Any) -> int:
+            return len(shortcuts(v)) - len(inn[v]) - len(out[v]) + deleted[v]
+
+        pq = [(priority(v), i, v) for i, v in enumerate(out)]
+        heapq.heapify(pq)
+        rank: Dict[Any, int] = {}
+        up: Dict[Any, Dict[Any, Arc]] = {}
+        down: Dict[Any, Dict[Any, Arc]] = {}
+        while pq:
+            p, i, v = heapq.heappop(pq)
+            fresh = priority(v)
+            if pq and fresh > pq[0][0]:
+                heapq.heappush(pq, (fresh, i, v))
+                continue
+            for u, x, via in shortcuts(v):
+                if via < out[u].get(x, (INF, None))[0]:
+                    out[u][x] = (via, v); inn[x][u] = (via, v)
+            rank[v] = len(rank)
+            up[v] = out.pop(v); down[v] = inn.pop(v)
+            for x in up[v]:
+                del inn[x][v]; deleted[x] += 1
+            for u in down[v]:
+                del out[u][v]; deleted[u] += 1
+        return cls(rank, up, down)
+
+    def _search(self, source: Any, target: Any):
+        dist = ({source: 0.0}, {target: 0.0})
+        parent: Tuple[Dict[Any, Any], Dict[Any, Any]] = ({source: None}, {target: None})
+        pqs = ([(0.0, source)], [(0.0, target)])
+        graphs = (self._up, self._down)
+        best, meet = INF, None
+        while pqs[0] or pqs[1]:
+            side = 0 if pqs[0] and (not pqs[1] or pqs[0][0][0] <= pqs[1][0][0]) else 1
+            du, u = heapq.heappop(pqs[side])
+            if du >= best:
+                pqs[side].clear()
+                continue
+            if du > dist[side][u]:
+                continue
+            other = dist[1 - side].get(u)
+            if other is not None and du + other < best:
+                best, meet = du + other, u
+            # Stall-on-demand: a higher-ranked node already reaches u more cheaply.
+            if any(dist[side].get(x, INF) + w < du for x, (w, _) in graphs[1 - side].get(u, {}).items()):
+                continue
+            for v, (w, mid) in graphs[side].get(u, {}).items():
+                alt = du + w
+                if alt < dist[side].get(v, INF):
+                    dist[side][v] = alt; parent[side][v] = (u, mid)
+                    heapq.heappush(pqs[side], (alt, v))
+        return best, meet, parent
+
+    def distance(self, source: Any, target: Any) -> float:
+        if source not in self.rank or target not in self.rank:
+            return INF
+        if source == target:
+            return 0.0
+        return self._search(source, target)[0]
+
+    def _unpack(self, a: Any, b: Any, mid: Optional[Any], out: List[Any]) -> None:
+        # Appends the original nodes after a on the a->b arc, ending with b.
+        stack = [(a, b, mid)]
+        while stack:
+            x, y, m = stack.pop()
+            if m is None:
+                out.append(y)
+                continue
+            # m was contracted before x and y, so x->m lives in down[m] and m->y in up[m].
+            stack.append((m, y, self._up[m][y][1]))
+            stack.append((x, m, self._down[m][x][1]))
+
+    def shortest_path(self, source: Any, target: Any) -> Tuple[float, List[Any]]:
+        if source not in self.rank or target not in self.rank:
+            return INF, []
+        if source == target:
+            return 0.0, [source]
+        best, meet, parent = self._search(source, target)
+        if meet is None:
+            return INF, []
+        arcs: List[Tuple[Any, Any, Optional[Any]]] = []
+        node = meet
+        while parent[0][node] is not None:
+            prev, mid = parent[0][node]
+            arcs.append((prev, node, mid)); node = prev
+        arcs.reverse()
+        node = meet
+        while parent[1][node] is not None:
+            nxt, mid = parent[1][node]
+            arcs.append((node, nxt, mid)); node = nxt
+        path = [source]
+        for a, b, mid in arcs:
+            self._unpack(a, b, mid, path)
+        return best, path
+
+    def num_shortcuts(self) -> int:
+        return sum(1 for arcs in self._up.values() for _, mid in arcs.values() if mid is not None)
+
+    # File: header (magic, version, n), then length-prefixed sections: the node label table
+    # (int or str labels), rank int64[n], and for the up and down arcs the parallel arrays
+    # tail int64, head int64, weight float64, middle int64 (-1 for an original edge).
+    # Nothing is unpickled, so loading an untrusted file runs no code.
+    _MAGIC = b"GRAPHCH\0"
+    _HEADER = struct.Struct("<8sHxxxxxxq")
+
+    def save(self, path: str) -> None:
+        nodes = list(self.rank)
+        index = {u: i for i, u in enumerate(nodes)}
+        sections = [_encode_labels(nodes), array("q", (self.rank[u] for u in nodes)).tobytes()]
+        for adj in (self._up, self._down):
+            tail, head, weight, middle = array("q"), array("q"), array("d"), array("q")
+            for a, arcs in adj.items():
+                for b, (w, mid) in arcs.items():
+                    tail.append(index[a]); head.append(index[b]); weight.append(w)
+                    middle.append(-1 if mid is None else index[mid])
+            sections += [tail.tobytes(), head.tobytes(), weight.tobytes(), middle.tobytes()]
+        with open(path, "wb") as f:
+            f.write(self._HEADER.pack(self._MAGIC, 2, len(nodes)) + _pack_sections(sections))
+
+    @classmethod
+    def load(cls, path: str) -> "ContractionHierarchy":
+        with open(path, "rb") as f:
+            data = memoryview(f.read())
+        if len(data) < cls._HEADER.size:
+            raise ValueError("Not a contraction hierarchy.")
+        magic, version, n = cls._HEADER.unpack_from(data)
+        if magic != cls._MAGIC:
+            raise ValueError("Not a contraction hierarchy.")
+        if version != 2:
+            raise ValueError("Unsupported contraction hierarchy version.")
+        raw = _unpack_sections(data, cls._HEADER.size, 10)
+        if len(raw[1]) != 8 * n or any(len(r) % 8 for r in raw[2:]) or \
+                len({len(r) for r in raw[2:6]}) != 1 or len({len(r) for r in raw[6:]}) != 1:
+            raise ValueError("Contraction hierarchy sections do not match its header.")
+        nodes = _decode_labels(raw[0], n)
+        rank = dict(zip(nodes, raw[1].cast("q").tolist()))
+        adjs: List[Dict[Any, Dict[Any, Arc]]] = []
+        for tail, head, weight, middle in (raw[2:6], raw[6:10]):
+            adj: Dict[Any, Dict[Any, Arc]] = {u: {} for u in nodes}
+            ids = tail.cast("q").tolist(), head.cast("q").tolist(), middle.cast("q").tolist()
+            if any(not 0 <= i < n for i in ids[0] + ids[1]) or any(not -1 <= i < n for i in ids[2]):
+                raise ValueError("Contraction hierarchy arc refers to an unknown node.")
+            for a, b, w, mid in zip(ids[0], ids[1], weight.cast("d").tolist(), ids[2]):
+                adj[nodes[a]][nodes[b]] = (w, None if mid < 0 else nodes[mid])
+            adjs.append(adj)
+        return cls(rank, adjs[0], adjs[1])
+
+def main():
+    print("=== Contraction hierarchy on symmetric graph ===")
+    g = sample_symmetric_graph()
+    ch = ContractionHierarchy.build(g)
+    print("shortcuts:", ch.num_shortcuts())
+    print(ch.shortest_path("A", "Z"))
+
+    print("=== Contraction hierarchy on directed graph ===")
+    d = sample_directed_graph_general()
+    ch = ContractionHierarchy.build(d)
+    print(ch.shortest_path("A", "D"), ch.distance("D", "A"))
+
+if __name__ == "__main__":
+    main()
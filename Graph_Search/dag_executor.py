@@ -0,0 +1,137 @@
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from concurrent.futures import Executor, FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+import heapq
+import time
+from graph_base import Graph
+from toposort_kahn import toposort_kahn
+from common_utils import sample_directed_graph_acyclic, sample_symmetric_graph
+
+@dataclass
+class TaskTiming:
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+@dataclass
+class DAGRunResult:
+    results: Dict[Any, Any] = field(default_factory=dict)
+    timings: Dict[Any, TaskTiming] = field(default_factory=dict)
+    completed: List[Any] = field(default_factory=list)
+    wall_time: float = 0.0
+
+def _timed(fn: Callable[[], Any]) -> Tuple[Any, float, float]:
+    # perf_counter is a system-wide monotonic clock, so worker timestamps line up with ours.
+    start = time.perf_counter()
+    out = fn()
+    return out, start, time.perf_counter()
+
+def critical_path_lengths(graph: Graph, costs: Optional[Mapping[Any, float]] = None) -> Dict[Any, float]:
+    """Longest cost-weighted path from each node to any sink (the node's own cost included)."""
+    order = toposort_kahn(graph)
+    cost = (lambda u: costs.get(u, 1.0)) if costs is not None else (lambda u: 1.0)
+    rank: Dict[Any, float] = {}
+    for u in reversed(order):
+        rank[u] = cost(u) + max((rank[v] for v in graph.neighbors(u)), default=0.0)
+    return rank
+
+def run_dag(graph: Graph, tasks: Mapping[Any, Callable[[], Any]], max_workers: Optional[int] = None,
+            executor: Union[str, Executor] = "thread", priority: Optional[str] = None,
+            costs: Optional[Mapping[Any, float]] = None) -> DAGRunResult:
+    """
+    Executes tasks[u]() for every node once all its predecessors have finished.
+    Ready nodes (in-degree 0, as in Kahn's algorithm) are dispatched to a thread or process
+    pool with at most max_workers in flight; priority="critical_path" dispatches the ready
+    node with the longest remaining cost-weighted path first. Nodes without a task are no-ops.
+    The first task exception is re-raised after in-flight tasks drain.
+    """
+    if not graph.directed:
+        raise ValueError("Task scheduling is defined for directed acyclic graphs only.")
+    if priority not in (None, "critical_path"):
+        raise ValueError("priority must be None or 'critical_path'.")
+    rank = critical_path_lengths(graph, costs)  # also rejects cycles
+    indeg: Dict[Any, int] = {u: 0 for u in graph.nodes()}
+    for u in indeg:
+        for v in graph.neighbors(u): indeg[v] += 1
+    ready: List[Tuple[float, int, Any]] = []
+    seq = 0
+    def push(u: Any) -> None:
+        nonlocal seq
+        heapq.heappush(ready, (-rank[u] if priority else 0.0, seq, u)); seq += 1
+    for u, d in indeg.items():
+        if d == 0: push(u)
+
+    owns_pool = isinstance(executor, str)
+    if executor == "thread":
+        pool: Executor = ThreadPoolExecutor(max_workers=max_workers)
+    elif executor == "process":
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+    elif isinstance(executor, Executor):
+        pool = executor
+    else:
+        raise ValueError("executor must be 'thread', 'process' or an Executor instance.")
+    cap = max_workers or getattr(pool, "_max_workers", None) or 1
+
+    out = DAGRunResult()
+    t0 = time.perf_counter()
+    running: Dict[Future, Any] = {}
+    error: Optional[BaseException] = None
+
+    def finish(u: Any, value: Any, start: float, end: float) -> None:
+        out.results[u] = value; out.timings[u] = TaskTiming(start - t0, end - t0); out.completed.append(u)
+        for v in graph.neighbors(u):
+            indeg[v] -= 1
+            if indeg[v] == 0: push(v)
+
+    try:
+        while ready or running:
+            while ready and error is None and len(running) < cap:
+                _, _, u = heapq.heappop(ready)
+                fn = tasks.get(u)
+                if fn is None:
+                    now = time.perf_counter()
+                    finish(u, None, now, now)
+                    continue
+                running[pool.submit(_timed, fn)] = u
+            if not running:
+                if error is not None:
+                    break
+                continue
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for fut in done:
+                u = running.pop(fut)
+                exc = fut.exception()
+                if exc is not None:
+                    error = error or exc
+                    continue
+                value, start, end = fut.result()
+                if error is None:
+                    finish(u, value, start, end)
+            if error is not None and not running:
+                break
+    finally:
+        if owns_pool:
+            pool.shutdown(wait=True)
+    if error is not None:
+        raise error
+    out.wall_time = time.perf_counter() - t0
+    return out
+
+def main():
+    print("=== Run a DAG of tasks on a thread pool (critical-path priority) ===")
+    dag = sample_directed_graph_acyclic()
+    tasks = {u: (lambda u=u: (time.sleep(0.01), u.upper())[1]) for u in dag.nodes()}
+    res = run_dag(dag, tasks, max_workers=2, priority="critical_path")
+    print(res.completed, res.results)
+    print({u: round(t.duration, 3) for u, t in res.timings.items()})
+    print("=== Run on symmetric graph (should raise) ===")
+    try:
+        run_dag(sample_symmetric_graph(), {})
+    except Exception as e:
+        print("Not applicable:", e)
+
+if __name__ == "__main__":
+    main()
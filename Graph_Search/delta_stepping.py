@@ -0,0 +1,163 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from graph_base import Graph, CSRGraph
+from shared_arrays import SharedSpec, attach_arrays, share_arrays
+from common_utils import sample_symmetric_graph, sample_directed_graph_general
+
+try:
+    import numpy as np
+except ImportError:  # buckets are relaxed as whole NumPy arrays
+    np = None
+
+INF = float("inf")
+
+def _split(indptr, indices, weights, keep):
+    # Sub-CSR holding only the arcs where keep is true (row order preserved).
+    counts = np.zeros(keep.size + 1, dtype=np.int64)
+    np.cumsum(keep, out=counts[1:])
+    return counts[indptr], indices[keep].astype(np.int64), weights[keep]
+
+def _relax(ptr, ix, wt, dist, frontier):
+    """Candidate (target, distance, source) triples that improve dist, one per target (the best)."""
+    starts = ptr[frontier]
+    lengths = ptr[frontier + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return frontier[:0], dist[:0], frontier[:0]
+    arcs = np.arange(total) + np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    tgt, src = ix[arcs], np.repeat(frontier, lengths)
+    cand = dist[src] + wt[arcs]
+    better = cand < dist[tgt]
+    tgt, cand, src = tgt[better], cand[better], src[better]
+    if tgt.size > 1:
+        order = np.lexsort((cand, tgt))
+        tgt, cand, src = tgt[order], cand[order], src[order]
+        first = np.ones(tgt.size, dtype=bool); first[1:] = tgt[1:] != tgt[:-1]
+        tgt, cand, src = tgt[first], cand[first], src[first]
+    return tgt, cand, src
+
+def _apply(dist, parent, parts) -> Any:
+    # Merges per-partition candidates, writes the improvements and returns the improved ids.
+    tgt = np.concatenate([p[0] for p in parts]); cand = np.concatenate([p[1] for p in parts])
+    src = np.concatenate([p[2] for p in parts])
+    if len(parts) > 1 and tgt.size > 1:
+        order = np.lexsort((cand, tgt))
+        tgt, cand, src = tgt[order], cand[order], src[order]
+        first = np.ones(tgt.size, dtype=bool); first[1:] = tgt[1:] != tgt[:-1]
+        tgt, cand, src = tgt[first], cand[first], src[first]
+    better = cand < dist[tgt]
+    tgt = tgt[better]
+    dist[tgt] = cand[better]; parent[tgt] = src[better]
+    return tgt
+
+# Per-process views of the shared light/heavy CSR arrays and the distance vector, set by _attach.
+_shared: Optional[Tuple[Any, List[Any]]] = None
+
+def _attach(spec: SharedSpec) -> None:
+    global _shared
+    shm, views = attach_arrays(spec)
+    _shared = (shm, [np.frombuffer(v, dtype=np.dtype(v.format)) for v in views])
+
+def _relax_task(heavy: bool, frontier):
+    lptr, lix, lwt, hptr, hix, hwt, dist = _shared[1]
+    return _relax(hptr, hix, hwt, dist, frontier) if heavy else _relax(lptr, lix, lwt, dist, frontier)
+
+def csr_delta_stepping(indptr, indices, weights, source: int, delta: Optional[float] = None,
+                       workers: int = 1, parallel_threshold: int = 1 << 15):
+    """
+    Delta-stepping over CSR arrays; returns (dist float64, parent int64) indexed by node id
+    (inf / -1 when unreachable). Tentative distances are grouped into buckets of width delta.
+    Each bucket's light arcs (w <= delta) are relaxed as one vectorized gather and
+    segmented min, repeated until the bucket stops changing; heavy arcs are relaxed
+    once per settled bucket. With workers > 1, frontiers of at least parallel_threshold
+    nodes are split into edge-balanced vertex ranges and relaxed in a process pool that
+    reads the CSR and the distances from shared memory.
+    """
+    if np is None:
+        raise ImportError("delta_stepping requires NumPy.")
+    indptr = np.asarray(indptr, dtype=np.int64); indices = np.asarray(indices)
+    weights = np.asarray(weights, dtype=np.float64)
+    n = indptr.size - 1
+    if weights.size and weights.min() < 0:
+        raise ValueError("Delta-stepping requires non-negative weights.")
+    if delta is None:
+        # Max weight over average degree: light phases stay short without too many buckets.
+        positive = weights[weights > 0]
+        delta = float(max(positive.max() / max(weights.size / max(n, 1), 1.0), positive.min())) if positive.size else 1.0
+    light = weights <= delta
+    lptr, lix, lwt = _split(indptr, indices, weights, light)
+    hptr, hix, hwt = _split(indptr, indices, weights, ~light)
+
+    pool = None
+    shm = None
+    try:
+        if workers > 1 and n >= parallel_threshold:
+            shm, spec = share_arrays([lptr, lix, lwt, hptr, hix, hwt, np.full(n, INF)])
+            dist = np.frombuffer(shm.buf, dtype=np.float64, count=n, offset=spec[1][-1][0])  # main writes, workers read
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_attach, initargs=(spec,))
+            bounds = np.searchsorted(indptr, np.linspace(0, indices.size, workers + 1)[1:-1])
+        else:
+            dist = np.full(n, INF)
+        parent = np.full(n, -1, dtype=np.int64)
+
+        def relax(heavy: bool, frontier):
+            if pool is None or frontier.size < parallel_threshold:
+                ptr, ix, wt = (hptr, hix, hwt) if heavy else (lptr, lix, lwt)
+                return _apply(dist, parent, [_relax(ptr, ix, wt, dist, frontier)])
+            parts = np.split(frontier, np.searchsorted(frontier, bounds))
+            return _apply(dist, parent, list(pool.map(_relax_task, [heavy] * len(parts), parts)))
+
+        dist[source] = 0.0
+        pending = np.array([source], dtype=np.int64)
+        while pending.size:
+            hi = (np.floor(dist[pending].min() / delta) + 1) * delta
+            inside = dist[pending] < hi
+            frontier, pending = np.unique(pending[inside]), pending[~inside]
+            settled = []
+            while frontier.size:
+                settled.append(frontier)
+                improved = relax(False, frontier)
+                again = dist[improved] < hi
+                frontier = np.unique(improved[again])
+                pending = np.concatenate((pending, improved[~again]))
+            improved = relax(True, np.unique(np.concatenate(settled)))
+            pending = np.concatenate((pending, improved))
+            pending = np.unique(pending[dist[pending] >= hi])
+        return dist.copy(), parent
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if shm is not None:
+            dist = None  # release the buffer export before closing
+            shm.unlink()
+            try:
+                shm.close()
+            except BufferError:
+                # A propagating exception's traceback frames still hold views of the
+                # segment; it is already unlinked and is unmapped once they are gone.
+                pass
+
+def delta_stepping(graph: Union[Graph, CSRGraph], source: Any, delta: Optional[float] = None,
+                   workers: int = 1, parallel_threshold: int = 1 << 15) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """Same (dist, parent) dicts as dijkstra(graph, source), computed by csr_delta_stepping."""
+    csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+    indptr, indices, weights = csr.to_numpy()
+    dist, parent = csr_delta_stepping(indptr, indices, weights, csr.index_of(source), delta, workers,
+                                      parallel_threshold)
+    labels = csr.nodes()
+    return (dict(zip(labels, dist.tolist())),
+            {u: (labels[p] if p >= 0 else None) for u, p in zip(labels, parent.tolist())})
+
+def main():
+    if np is None:
+        print("NumPy is required for delta-stepping.")
+        return
+    print("=== Delta-stepping on symmetric graph ===")
+    g = sample_symmetric_graph()
+    print(delta_stepping(g, "A", delta=3)[0])
+    print("=== Delta-stepping on directed graph ===")
+    d = sample_directed_graph_general()
+    print(delta_stepping(d, "A")[0])
+
+if __name__ == "__main__":
+    main()
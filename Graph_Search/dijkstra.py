@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Set, Tuple, List
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple, List
 import heapq
 from graph_base import Graph
 from common_utils import sample_symmetric_graph, sample_directed_graph_general
@@ -24,6 +24,86 @@ def dijkstra(graph: Graph, source: Any) -> Tuple[Dict[Any, float], Dict[Any, Opt
                 dist[v] = alt; parent[v] = u; heapq.heappush(pq, (alt, v))
     return dist, parent
 
+Neighbors = Callable[[Any], Iterable[Tuple[Any, float]]]
+
+def _path(parent: Dict[Any, Optional[Any]], node: Any) -> List[Any]:
+    path: List[Any] = []
+    while node is not None:
+        path.append(node); node = parent[node]
+    path.reverse()
+    return path
+
+def _search_to_target(neighbors: Neighbors, source: Any, target: Any,
+                      heuristic: Optional[Callable[[Any], float]] = None) -> Tuple[float, List[Any]]:
+    # State is allocated only for reached nodes; the loop stops once target is settled.
+    # A consistent heuristic (a lower bound on the distance to target) turns this into A*;
+    # nodes it rates at inf cannot reach target and are never queued.
+    h = heuristic
+    dist: Dict[Any, float] = {source: 0.0}
+    parent: Dict[Any, Optional[Any]] = {source: None}
+    # (key, distance, node): the pushed distance detects stale entries without re-evaluating h.
+    pq: List[Tuple[float, float, Any]] = [(h(source) if h else 0.0, 0.0, source)]
+    while pq:
+        _, du, u = heapq.heappop(pq)
+        if du > dist[u]:
+            continue
+        if u == target:
+            return du, _path(parent, u)
+        for v, w in neighbors(u):
+            if w < 0:
+                raise ValueError("Dijkstra requires non-negative weights.")
+            alt = du + w
+            if alt < dist.get(v, INF):
+                hv = h(v) if h else 0.0
+                if hv == INF:
+                    continue
+                dist[v] = alt; parent[v] = u; heapq.heappush(pq, (alt + hv, alt, v))
+    return INF, []
+
+def _bidirectional_search(forward: Neighbors, backward: Neighbors, source: Any, target: Any) -> Tuple[float, List[Any]]:
+    dist = ({source: 0.0}, {target: 0.0})
+    parent: Tuple[Dict[Any, Optional[Any]], Dict[Any, Optional[Any]]] = ({source: None}, {target: None})
+    pqs: Tuple[List[Tuple[float, Any]], List[Tuple[float, Any]]] = ([(0.0, source)], [(0.0, target)])
+    expand = (forward, backward)
+    best, meet = INF, None
+    while pqs[0] and pqs[1]:
+        if pqs[0][0][0] + pqs[1][0][0] >= best:
+            break
+        side = 0 if pqs[0][0][0] <= pqs[1][0][0] else 1
+        du, u = heapq.heappop(pqs[side])
+        d_this, d_other = dist[side], dist[1 - side]
+        if du > d_this[u]:
+            continue
+        for v, w in expand[side](u):
+            if w < 0:
+                raise ValueError("Dijkstra requires non-negative weights.")
+            alt = du + w
+            if alt < d_this.get(v, INF):
+                d_this[v] = alt; parent[side][v] = u; heapq.heappush(pqs[side], (alt, v))
+            dv = d_other.get(v)
+            if dv is not None and alt + dv < best:
+                best, meet = alt + dv, v
+    if meet is None:
+        return INF, []
+    fwd = _path(parent[0], meet)
+    node = parent[1][meet]
+    while node is not None:
+        fwd.append(node); node = parent[1][node]
+    return best, fwd
+
+def shortest_path(graph: Graph, source: Any, target: Any, bidirectional: bool = False) -> Tuple[float, List[Any]]:
+    """
+    Single source->target query. Returns (distance, path), or (inf, []) if target is unreachable.
+    bidirectional=True searches forward from source and backward (over predecessors) from target at once.
+    """
+    if source == target:
+        return 0.0, [source]
+    forward = lambda u: graph.neighbors(u).items()
+    if not bidirectional:
+        return _search_to_target(forward, source, target)
+    backward = lambda u: graph.predecessors(u).items()
+    return _bidirectional_search(forward, backward, source, target)
+
 def main():
     print("=== Dijkstra on symmetric graph ===")
     g = sample_symmetric_graph()
@@ -33,5 +113,9 @@ def main():
     d = sample_directed_graph_general()
     print(dijkstra(d, "A")[0])
 
+    print("=== Point-to-point queries (unidirectional / bidirectional) ===")
+    print(shortest_path(g, "A", "Z"), shortest_path(g, "A", "Z", bidirectional=True))
+    print(shortest_path(d, "B", "D"), shortest_path(d, "D", "A", bidirectional=True))
+
 if __name__ == "__main__":
     main()
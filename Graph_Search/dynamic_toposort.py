@@ -0,0 +1,85 @@
+from typing import Any, Dict, List, Optional, Set
+from graph_base import Graph
+from toposort_kahn import toposort_kahn
+from common_utils import sample_directed_graph_acyclic
+
+class DynamicTopologicalOrder:
+    """
+    Topological order maintained under edge insertions (Pearce–Kelly).
+    Inserting u->v with ord(u) > ord(v) only searches the affected region
+    ord(v)..ord(u): forward from v and backward from u, then reuses the
+    freed positions. Edges that would close a cycle are rejected untouched.
+    Edges must be added through this object to keep the order valid.
+    """
+    def __init__(self, graph: Optional[Graph] = None) -> None:
+        if graph is None:
+            graph = Graph(directed=True)
+        if not graph.directed:
+            raise ValueError("Topological order is defined for directed acyclic graphs only.")
+        self.graph = graph
+        self._at: List[Any] = toposort_kahn(graph)
+        self._ord: Dict[Any, int] = {u: i for i, u in enumerate(self._at)}
+
+    def add_node(self, u: Any) -> None:
+        if u not in self._ord:
+            self.graph.add_node(u)
+            self._ord[u] = len(self._at); self._at.append(u)
+
+    def add_edge(self, u: Any, v: Any, weight: float = 1.0) -> None:
+        if u == v:
+            raise ValueError(f"Edge {u!r}->{v!r} would create a cycle.")
+        self.add_node(u); self.add_node(v)
+        lb, ub = self._ord[v], self._ord[u]
+        if lb < ub:
+            forward = self._discover(v, ub, forward=True)
+            if forward is None:
+                raise ValueError(f"Edge {u!r}->{v!r} would create a cycle.")
+            backward = self._discover(u, lb, forward=False)
+            self._reorder(backward, forward)
+        self.graph.add_edge(u, v, weight)
+
+    def _discover(self, start: Any, bound: int, forward: bool) -> Optional[List[Any]]:
+        # Forward: nodes reachable from start with ord < bound (None if the bound node is hit).
+        # Backward: nodes reaching start with ord > bound.
+        seen: Set[Any] = {start}
+        stack = [start]
+        while stack:
+            x = stack.pop()
+            nbrs = self.graph.neighbors(x) if forward else self.graph.predecessors(x)
+            for y in nbrs:
+                oy = self._ord[y]
+                if forward and oy == bound:
+                    return None
+                if y not in seen and (oy < bound if forward else oy > bound):
+                    seen.add(y); stack.append(y)
+        return list(seen)
+
+    def _reorder(self, backward: List[Any], forward: List[Any]) -> None:
+        key = self._ord.__getitem__
+        backward.sort(key=key); forward.sort(key=key)
+        slots = sorted(map(key, backward + forward))
+        for node, i in zip(backward + forward, slots):
+            self._ord[node] = i; self._at[i] = node
+
+    def order_of(self, u: Any) -> int:
+        return self._ord[u]
+
+    def precedes(self, u: Any, v: Any) -> bool:
+        return self._ord[u] < self._ord[v]
+
+    def order(self) -> List[Any]:
+        return list(self._at)
+
+def main():
+    print("=== Dynamic topological order under insertions ===")
+    dto = DynamicTopologicalOrder(sample_directed_graph_acyclic())
+    print(dto.order())
+    dto.add_edge("wake", "plan")
+    print(dto.order(), "wake before eat?", dto.precedes("wake", "eat"))
+    try:
+        dto.add_edge("eat", "wake")
+    except ValueError as e:
+        print("Rejected:", e)
+
+if __name__ == "__main__":
+    main()
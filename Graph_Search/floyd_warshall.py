@@ -1,14 +1,19 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 from graph_base import Graph
 from common_utils import sample_symmetric_graph, sample_directed_graph_general
 
+try:
+    import numpy as np
+except ImportError:  # the matrix engine is optional; the dict version needs nothing
+    np = None
+
 INF = float("inf")
 
 def floyd_warshall(graph: Graph) -> Dict[Any, Dict[Any, float]]:
     nodes = graph.nodes()
     dist: Dict[Any, Dict[Any, float]] = {u: {v: INF for v in nodes} for u in nodes}
     for u in nodes: dist[u][u] = 0.0
-    for u, v, w in graph.edges():
+    for u, v, w in graph.iter_edges():
         dist[u][v] = min(dist[u][v], w)
         if not graph.directed:
             dist[v][u] = min(dist[v][u], w)
@@ -26,6 +31,95 @@ def floyd_warshall(graph: Graph) -> Dict[Any, Dict[Any, float]]:
             raise ValueError("Negative-weight cycle.")
     return dist
 
+def _relax_block(D, P, ks: range, rows: slice, cols: slice) -> None:
+    # One broadcasted minimum per k over the (rows x cols) tile.
+    for k in ks:
+        alt = D[rows, k, None] + D[k, cols][None, :]
+        if P is None:
+            np.minimum(D[rows, cols], alt, out=D[rows, cols])
+            continue
+        better = alt < D[rows, cols]
+        if better.any():
+            D[rows, cols] = np.where(better, alt, D[rows, cols])
+            P[rows, cols] = np.where(better, P[k, cols][None, :], P[rows, cols])
+
+def floyd_warshall_matrix(graph: Graph, block_size: Optional[int] = None, dtype: str = "float64",
+                          predecessors: bool = False, as_dict: bool = False):
+    """
+    Vectorized Floyd–Warshall on a dense NumPy matrix (nodes mapped to 0..n-1).
+    Returns (nodes, dist), plus a predecessor matrix (pred[i, j] = index before j on
+    the i->j path, -1 if none) when predecessors=True. block_size enables the
+    cache-blocked three-phase schedule for distances only: with zero-weight edges the
+    tiled k-order can leave predecessor cycles, so predecessors always use plain k-order.
+    dtype="float32" halves memory.
+    With as_dict=True the result uses the same dict-of-dicts shape as floyd_warshall.
+    """
+    if np is None:
+        raise ImportError("floyd_warshall_matrix requires NumPy.")
+    nodes = graph.nodes()
+    n = len(nodes)
+    index = {u: i for i, u in enumerate(nodes)}
+    if n == 0:
+        if as_dict:
+            return ({}, {}) if predecessors else {}
+        empty = np.zeros((0, 0), dtype=dtype)
+        return (nodes, empty, np.zeros((0, 0), dtype=np.int32)) if predecessors else (nodes, empty)
+    D = np.full((n, n), INF, dtype=dtype)
+    P = np.full((n, n), -1, dtype=np.int32 if n < 2**31 else np.int64) if predecessors else None
+    edges = graph.edges()
+    if edges:
+        src = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+        dst = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+        wts = np.fromiter((w for _, _, w in edges), dtype=np.float64, count=len(edges))
+        if not graph.directed:
+            src, dst, wts = np.concatenate((src, dst)), np.concatenate((dst, src)), np.concatenate((wts, wts))
+        np.minimum.at(D, (src, dst), wts.astype(D.dtype))
+        if P is not None:
+            hit = D[src, dst] == wts.astype(D.dtype)
+            P[src[hit], dst[hit]] = src[hit]
+    diag = np.arange(n)
+    D[diag, diag] = np.minimum(D[diag, diag], 0.0)
+    if P is not None:
+        P[diag, diag] = -1
+    b = n if not block_size or block_size >= n or predecessors else block_size
+    blocks = [slice(s, min(s + b, n)) for s in range(0, n, b)]
+    for kb in blocks:
+        ks = range(kb.start, kb.stop)
+        _relax_block(D, P, ks, kb, kb)
+        for other in blocks:
+            if other != kb:
+                _relax_block(D, P, ks, kb, other)
+                _relax_block(D, P, ks, other, kb)
+        for ib in blocks:
+            if ib == kb:
+                continue
+            for jb in blocks:
+                if jb != kb:
+                    _relax_block(D, P, ks, ib, jb)
+    if (np.diagonal(D) < 0).any():
+        raise ValueError("Negative-weight cycle.")
+    if as_dict:
+        dist = {u: dict(zip(nodes, row)) for u, row in zip(nodes, D.tolist())}
+        if P is None:
+            return dist
+        pred = {u: {v: (nodes[p] if p >= 0 else None) for v, p in zip(nodes, row)} for u, row in zip(nodes, P.tolist())}
+        return dist, pred
+    if P is None:
+        return nodes, D
+    return nodes, D, P
+
+def reconstruct_path(pred, i: int, j: int) -> List[int]:
+    if i != j and pred[i, j] < 0:
+        return []
+    path = [j]
+    while j != i:
+        if len(path) > len(pred):
+            raise ValueError("Predecessor matrix has a cycle.")
+        j = int(pred[i, j])
+        path.append(j)
+    path.reverse()
+    return path
+
 def main():
     print("=== Floyd–Warshall on symmetric graph ===")
     g = sample_symmetric_graph()
@@ -35,5 +129,12 @@ def main():
     d = sample_directed_graph_general()
     print(floyd_warshall(d)["A"]["D"])
 
+    if np is None:
+        return
+    print("=== Blocked matrix Floyd–Warshall with path reconstruction ===")
+    nodes, dist, pred = floyd_warshall_matrix(g, block_size=2, predecessors=True)
+    i, j = nodes.index("A"), nodes.index("Z")
+    print(dist[i, j], [nodes[k] for k in reconstruct_path(pred, i, j)])
+
 if __name__ == "__main__":
     main()
@@ -1,5 +1,8 @@
 from __future__ import annotations
-from typing import Dict, Iterable, Iterator, List, Tuple, TypeVar, Generic, Optional, Set
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, TypeVar, Generic, Optional, Set
 
 # Generic Type used to store any type of data in graph nodes.
 T = TypeVar("T")
@@ -8,20 +11,56 @@ class Graph(Generic[T]):
     def __init__(self, directed: bool) -> None:
         self._directed = directed
         self._adj: Dict[T, Dict[T, float]] = {}
+        # In-edge index for directed graphs, kept in sync by add_edge.
+        self._pred: Dict[T, Dict[T, float]] = {}
+        # Mutation counter and listeners called as f(u, v, old_weight, new_weight);
+        # v is None when u is a newly added node, old_weight is None for a new edge.
+        self._version = 0
+        self._listeners: List[Callable[[T, Optional[T], Optional[float], Optional[float]], None]] = []
+        # Insertion index per node: the canonical orientation of an undirected edge is
+        # (earlier, later). The edge list is cached until the next mutation.
+        self._order: Dict[T, int] = {}
+        self._edge_cache: Optional[List[Tuple[T, T, float]]] = None
+        self._edge_cache_version = -1
+        self._csr_cache: Optional["CSRGraph[T]"] = None
+        self._csr_cache_version = -1
 
     @property
     def directed(self) -> bool:
         return self._directed
 
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def add_listener(self, fn: Callable[[T, Optional[T], Optional[float], Optional[float]], None]) -> None:
+        self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[T, Optional[T], Optional[float], Optional[float]], None]) -> None:
+        self._listeners.remove(fn)
+
+    def _notify(self, u: T, v: Optional[T], old: Optional[float], new: Optional[float]) -> None:
+        self._version += 1
+        for fn in self._listeners:
+            fn(u, v, old, new)
+
     def add_node(self, u: T) -> None:
         if u not in self._adj:
             self._adj[u] = {}
+            self._order[u] = len(self._order)
+            if self._directed:
+                self._pred[u] = {}
+            self._notify(u, None, None, None)
 
     def add_edge(self, u: T, v: T, weight: float = 1.0) -> None:
         self.add_node(u); self.add_node(v)
+        old = self._adj[u].get(v)
         self._adj[u][v] = weight
-        if not self._directed:
+        if self._directed:
+            self._pred[v][u] = weight
+        else:
             self._adj[v][u] = weight
+        self._notify(u, v, old, weight)
 
     def add_edges_from(self, edges: Iterable[Tuple[T, T, float]]) -> None:
         for u, v, w in edges:
@@ -30,22 +69,43 @@ class Graph(Generic[T]):
     def neighbors(self, u: T) -> Dict[T, float]:
         return self._adj.get(u, {})
 
+    def predecessors(self, u: T) -> Dict[T, float]:
+        if not self._directed:
+            return self.neighbors(u)
+        return self._pred.get(u, {})
+
     def nodes(self) -> List[T]:
         return list(self._adj.keys())
 
-    def edges(self) -> List[Tuple[T, T, float]]:
+    def iter_edges(self) -> Iterator[Tuple[T, T, float]]:
+        """Yields each edge once; undirected edges as (u, v, w) with u inserted no later than v."""
+        if self._edge_cache_version == self._version:
+            yield from self._edge_cache
+            return
         if self._directed:
-            return [(u, v, w) for u, nbrs in self._adj.items() for v, w in nbrs.items()]
-        seen = set()
-        out = []
+            for u, nbrs in self._adj.items():
+                for v, w in nbrs.items():
+                    yield (u, v, w)
+            return
+        order = self._order
         for u, nbrs in self._adj.items():
+            ou = order[u]
             for v, w in nbrs.items():
-                a, b = (u, v) if str(u) <= str(v) else (v, u)
-                if (a, b) in seen: 
-                    continue
-                seen.add((a, b))
-                out.append((a, b, w))
-        return out
+                if ou <= order[v]:
+                    yield (u, v, w)
+
+    def edges(self) -> List[Tuple[T, T, float]]:
+        if self._edge_cache_version != self._version:
+            self._edge_cache = list(self.iter_edges())
+            self._edge_cache_version = self._version
+        return list(self._edge_cache)
+
+    def to_csr(self) -> "CSRGraph[T]":
+        """CSRGraph.from_graph(self), cached until the next mutation (it is frozen, so sharing is safe)."""
+        if self._csr_cache_version != self._version:
+            self._csr_cache = CSRGraph.from_graph(self)
+            self._csr_cache_version = self._version
+        return self._csr_cache
 
     def undirected_view_neighbors(self, u: T):
         seen = set()
@@ -53,13 +113,379 @@ class Graph(Generic[T]):
             seen.add(v)
             yield (v, w)
         if self._directed:
-            for x, nbrs in self._adj.items():
-                if x == u: 
-                    continue
-                w = nbrs.get(u)
-                if w is not None and x not in seen:
+            for x, w in self._pred.get(u, {}).items():
+                if x != u and x not in seen:
                     yield (x, w)
 
+    def subgraph(self, nodes: Iterable[T]):
+        """Read-only induced-subgraph view sharing this adjacency (see graph_views)."""
+        from graph_views import SubgraphView
+        return SubgraphView(self, nodes)
+
+    def edge_filter(self, pred: Callable[[T, T, float], bool]):
+        """Read-only view keeping the edges with pred(u, v, w) true, evaluated lazily."""
+        from graph_views import EdgeFilterView
+        return EdgeFilterView(self, pred)
+
+    def reverse(self):
+        """Read-only view with every edge flipped (served from the in-edge index)."""
+        from graph_views import ReverseView
+        return ReverseView(self)
+
+    def save(self, path: str) -> None:
+        """Write a binary CSR snapshot; reopen it with CSRGraph.load (read-only, memory-mapped)."""
+        from graph_snapshot import save_graph
+        save_graph(self, path)
+
     def __repr__(self) -> str:
         typ = "Directed" if self._directed else "Undirected"
         return f"{typ}Graph(|V|={len(self._adj)})"
+
+
+class _CSRNeighbors(Mapping):
+    """Read-only neighbor mapping backed by one CSR row; no per-call dict is built."""
+    __slots__ = ("_g", "_lo", "_hi", "_ix", "_wt")
+
+    def __init__(self, g: "CSRGraph", lo: int, hi: int,
+                 ix: Optional[Sequence[int]] = None, wt: Optional[Sequence[float]] = None) -> None:
+        self._g = g; self._lo = lo; self._hi = hi
+        self._ix = g._indices if ix is None else ix
+        self._wt = g._weights if wt is None else wt
+
+    def _find(self, v: Any) -> int:
+        vid = self._g._index.get(v)
+        if vid is None:
+            return -1
+        i = bisect_left(self._ix, vid, self._lo, self._hi)
+        if i < self._hi and self._ix[i] == vid:
+            return i
+        return -1
+
+    def __getitem__(self, v: Any) -> float:
+        i = self._find(v)
+        if i < 0:
+            raise KeyError(v)
+        return self._wt[i]
+
+    def __contains__(self, v: Any) -> bool:
+        return self._find(v) >= 0
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self._g._labels.__getitem__, self._ix[self._lo:self._hi])
+
+    def __len__(self) -> int:
+        return self._hi - self._lo
+
+    def keys(self):
+        return self.__iter__()
+
+    def values(self):
+        return iter(self._wt[self._lo:self._hi])
+
+    def items(self):
+        return zip(self.__iter__(), self._wt[self._lo:self._hi])
+
+
+class _RangeIndex(Mapping):
+    """Label -> id map for graphs whose labels are exactly 0..n-1; costs nothing to build."""
+    __slots__ = ("_n",)
+
+    def __init__(self, n: int) -> None:
+        self._n = n
+
+    def __getitem__(self, x: Any) -> int:
+        if type(x) is int and 0 <= x < self._n:
+            return x
+        raise KeyError(x)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._n))
+
+    def __len__(self) -> int:
+        return self._n
+
+
+class CSRGraph(Generic[T]):
+    """
+    Frozen compressed-sparse-row graph.
+    Node labels are interned to dense ids 0..n-1; row u of the adjacency is
+    indices[indptr[u]:indptr[u+1]] (sorted by id) with matching weights.
+    Exposes the same read API as Graph, so the search algorithms accept it unchanged.
+    """
+    def __init__(self, directed: bool, labels: List[T], indptr: Sequence[int],
+                 indices: Sequence[int], weights: Sequence[float]) -> None:
+        self._directed = directed
+        self._labels = labels
+        # labels=range(n) (e.g. a mapped snapshot of an integer graph) skips the label dict.
+        self._index: Mapping = _RangeIndex(len(labels)) if isinstance(labels, range) else \
+            {x: i for i, x in enumerate(labels)}
+        self._indptr = indptr
+        self._indices = indices
+        self._weights = weights
+        self._rev: Optional[Tuple[Sequence[int], Sequence[int], Sequence[float]]] = None
+
+    @classmethod
+    def from_graph(cls, graph: "Graph[T]") -> "CSRGraph[T]":
+        labels = graph.nodes()
+        index = {x: i for i, x in enumerate(labels)}
+        n = len(labels)
+        indptr = array("q", [0])
+        indices = array("i" if n < 2**31 else "q")
+        weights = array("d")
+        for u in labels:
+            row = sorted((index[v], w) for v, w in graph.neighbors(u).items())
+            indices.extend(v for v, _ in row)
+            weights.extend(w for _, w in row)
+            indptr.append(len(indices))
+        return cls(graph.directed, labels, indptr, indices, weights)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[T, T, float]], directed: bool,
+                   nodes: Optional[Iterable[T]] = None) -> "CSRGraph[T]":
+        labels: List[T] = []
+        index: Dict[T, int] = {}
+        def intern(x: T) -> int:
+            i = index.get(x)
+            if i is None:
+                i = index[x] = len(labels); labels.append(x)
+            return i
+        for x in nodes or ():
+            intern(x)
+        src, dst, wts = array("q"), array("q"), array("d")
+        for u, v, w in edges:
+            src.append(intern(u)); dst.append(intern(v)); wts.append(w)
+        return cls.from_arrays(labels, src, dst, wts, directed)
+
+    @classmethod
+    def from_arrays(cls, labels: List[T], src: Sequence[int], dst: Sequence[int],
+                    weights: Sequence[float], directed: bool) -> "CSRGraph[T]":
+        """Build from parallel id arrays; undirected edges are given once and mirrored. Later duplicates win."""
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            return cls._from_arrays_numpy(np, labels, src, dst, weights, directed)
+        n = len(labels)
+        counts = array("q", [0]) * (n + 1)
+        for s in src: counts[s + 1] += 1
+        if not directed:
+            for s, d in zip(src, dst):
+                if s != d: counts[d + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        pos = counts[:-1]
+        tmp_idx = array("q", [0]) * counts[n]
+        tmp_w = array("d", [0.0]) * counts[n]
+        for s, d, w in zip(src, dst, weights):
+            p = pos[s]; tmp_idx[p] = d; tmp_w[p] = w; pos[s] = p + 1
+            if not directed and s != d:
+                p = pos[d]; tmp_idx[p] = s; tmp_w[p] = w; pos[d] = p + 1
+        indptr = array("q", [0])
+        indices = array("i" if n < 2**31 else "q")
+        out_w = array("d")
+        for u in range(n):
+            lo, hi = counts[u], counts[u + 1]
+            if hi - lo == 1:
+                indices.append(tmp_idx[lo]); out_w.append(tmp_w[lo])
+            elif hi > lo:
+                row = sorted(zip(tmp_idx[lo:hi], tmp_w[lo:hi]), key=lambda e: e[0])
+                for j, (v, w) in enumerate(row):
+                    if j + 1 < len(row) and row[j + 1][0] == v:
+                        continue
+                    indices.append(v); out_w.append(w)
+            indptr.append(len(indices))
+        return cls(directed, labels, indptr, indices, out_w)
+
+    @classmethod
+    def _from_arrays_numpy(cls, np, labels: List[T], src: Sequence[int], dst: Sequence[int],
+                           weights: Sequence[float], directed: bool) -> "CSRGraph[T]":
+        # Same result as the counting-sort path via one sort on (src, dst); the buffers are
+        # typed memoryviews over the NumPy results, so nothing is copied back into array('q').
+        n = len(labels)
+        s = np.asarray(src, dtype=np.int64); d = np.asarray(dst, dtype=np.int64)
+        w = np.asarray(weights, dtype=np.float64)
+        if not directed:
+            # Interleave each edge with its mirror so arc positions follow input order.
+            keep = np.ones(2 * s.size, dtype=bool); keep[1::2] = s != d
+            s, d = np.stack((s, d), axis=1).ravel()[keep], np.stack((d, s), axis=1).ravel()[keep]
+            w = np.repeat(w, 2)[keep]
+        order = np.argsort(s * n + d) if n * n < 2**63 else np.lexsort((d, s))
+        if order.size:
+            ss, dd = s[order], d[order]
+            starts = np.flatnonzero(np.concatenate(([True], (ss[1:] != ss[:-1]) | (dd[1:] != dd[:-1]))))
+            order = np.maximum.reduceat(order, starts)  # latest duplicate wins
+        s, d, w = s[order], d[order], w[order]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(s, minlength=n), out=indptr[1:])
+        tc = "i" if n < 2**31 else "q"
+        d = d.astype(np.int32 if tc == "i" else np.int64)
+        typed = lambda a, code: memoryview(np.ascontiguousarray(a)).cast("B").cast(code)
+        return cls(directed, labels, typed(indptr, "q"), typed(d, tc), typed(w, "d"))
+
+    @property
+    def directed(self) -> bool:
+        return self._directed
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self._labels)
+
+    @property
+    def num_edges(self) -> int:
+        m = len(self._indices)
+        if self._directed:
+            return m
+        loops = sum(1 for u in range(len(self._labels)) if self._has_arc(u, u))
+        return (m + loops) // 2
+
+    @property
+    def indptr(self) -> Sequence[int]:
+        return self._indptr
+
+    @property
+    def indices(self) -> Sequence[int]:
+        return self._indices
+
+    @property
+    def weights(self) -> Sequence[float]:
+        return self._weights
+
+    def to_numpy(self, reverse: bool = False):
+        """Zero-copy NumPy views (indptr, indices, weights) of the forward or reverse CSR."""
+        import numpy as np
+        ip, ix, wt = self._reverse() if reverse else (self._indptr, self._indices, self._weights)
+        return (np.frombuffer(ip, dtype=np.int64), np.frombuffer(ix, dtype=np.dtype(memoryview(ix).format)),
+                np.frombuffer(wt, dtype=np.float64))
+
+    def index_of(self, u: T) -> int:
+        return self._index[u]
+
+    def label_of(self, i: int) -> T:
+        return self._labels[i]
+
+    def neighbor_ids(self, i: int) -> Sequence[int]:
+        return self._indices[self._indptr[i]:self._indptr[i + 1]]
+
+    def _has_arc(self, u: int, v: int) -> bool:
+        lo, hi = self._indptr[u], self._indptr[u + 1]
+        i = bisect_left(self._indices, v, lo, hi)
+        return i < hi and self._indices[i] == v
+
+    def _reverse(self) -> Tuple[Sequence[int], Sequence[int], Sequence[float]]:
+        if self._rev is None:
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+            if np is not None:
+                self._rev = self._reverse_numpy(np)
+                return self._rev
+            n = len(self._labels)
+            counts = array("q", [0]) * (n + 1)
+            for v in self._indices: counts[v + 1] += 1
+            for i in range(n):
+                counts[i + 1] += counts[i]
+            pos = counts[:-1]
+            rindices = array("i" if n < 2**31 else "q", [0]) * len(self._indices)
+            rweights = array("d", [0.0]) * len(self._indices)
+            ip, ix, wt = self._indptr, self._indices, self._weights
+            for u in range(n):
+                for e in range(ip[u], ip[u + 1]):
+                    v = ix[e]; p = pos[v]
+                    rindices[p] = u; rweights[p] = wt[e]; pos[v] = p + 1
+            self._rev = (counts, rindices, rweights)
+        return self._rev
+
+    def _reverse_numpy(self, np) -> Tuple[Sequence[int], Sequence[int], Sequence[float]]:
+        # A stable sort by target keeps each reverse row ordered by source id, as the loop does.
+        n = len(self._labels)
+        ip, ix, wt = self.to_numpy()
+        order = np.argsort(ix, kind="stable")
+        src = np.repeat(np.arange(n, dtype=ix.dtype), np.diff(ip))
+        counts = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(ix, minlength=n), out=counts[1:])
+        typed = lambda a, code: memoryview(np.ascontiguousarray(a)).cast("B").cast(code)
+        return typed(counts, "q"), typed(src[order], "i" if n < 2**31 else "q"), typed(wt[order], "d")
+
+    def neighbors(self, u: T) -> Mapping:
+        i = self._index.get(u)
+        if i is None:
+            return {}
+        return _CSRNeighbors(self, self._indptr[i], self._indptr[i + 1])
+
+    def predecessors(self, u: T) -> Mapping:
+        if not self._directed:
+            return self.neighbors(u)
+        i = self._index.get(u)
+        if i is None:
+            return {}
+        rptr, rix, rwt = self._reverse()
+        return _CSRNeighbors(self, rptr[i], rptr[i + 1], rix, rwt)
+
+    def nodes(self) -> List[T]:
+        return list(self._labels)
+
+    def iter_edges(self) -> Iterator[Tuple[T, T, float]]:
+        # Ids are dense ints, so the canonical undirected orientation is a plain id compare.
+        lab, ip, ix, wt = self._labels, self._indptr, self._indices, self._weights
+        for u in range(len(lab)):
+            lu = lab[u]
+            for e in range(ip[u], ip[u + 1]):
+                v = ix[e]
+                if self._directed or u <= v:
+                    yield (lu, lab[v], wt[e])
+
+    def edges(self) -> List[Tuple[T, T, float]]:
+        return list(self.iter_edges())
+
+    def undirected_view_neighbors(self, u: T):
+        i = self._index.get(u)
+        if i is None:
+            return
+        yield from self.neighbors(u).items()
+        if self._directed:
+            rptr, rix, rwt = self._reverse()
+            for e in range(rptr[i], rptr[i + 1]):
+                x = rix[e]
+                if x != i and not self._has_arc(i, x):
+                    yield (self._labels[x], rwt[e])
+
+    def subgraph(self, nodes: Iterable[T]):
+        """Induced-subgraph view backed by a bytearray node mask."""
+        from graph_views import CSRMaskedView
+        return CSRMaskedView(self).subgraph(nodes)
+
+    def edge_filter(self, pred):
+        """Edge view from pred(u, v, w) (lazy) or a 0/1 mask with one entry per arc position."""
+        from graph_views import CSRMaskedView
+        return CSRMaskedView(self).edge_filter(pred)
+
+    def reverse(self):
+        from graph_views import ReverseView
+        return ReverseView(self)
+
+    def save(self, path: str) -> None:
+        from graph_snapshot import save_graph
+        save_graph(self, path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "CSRGraph":
+        from graph_snapshot import load_graph
+        return load_graph(path, mmap=mmap)
+
+    def __reduce__(self):
+        # NumPy-built and mapped buffers are memoryviews, which cannot be pickled: ship
+        # plain arrays instead and let the reverse index be rebuilt on first use.
+        def plain(buf: Sequence) -> array:
+            if isinstance(buf, array):
+                return buf
+            mv = memoryview(buf)
+            out = array(mv.format); out.frombytes(mv.tobytes())
+            return out
+        return (type(self), (self._directed, self._labels, plain(self._indptr),
+                             plain(self._indices), plain(self._weights)))
+
+    def __repr__(self) -> str:
+        typ = "Directed" if self._directed else "Undirected"
+        return f"{typ}CSRGraph(|V|={len(self._labels)}, |E|={self.num_edges})"
@@ -0,0 +1,107 @@
+from typing import List, Optional
+import math
+import random
+from graph_base import Graph
+
+# Seeded synthetic graphs for benchmarking. Nodes are the ints 0..n-1 (all added up front,
+# so isolated nodes exist too) and edge weights are uniform integers in 1..max_weight.
+
+def _empty(n: int, directed: bool) -> Graph:
+    g = Graph(directed=directed)
+    for u in range(n):
+        g.add_node(u)
+    return g
+
+def erdos_renyi(n: int, m: int, directed: bool = False, seed: Optional[int] = None, max_weight: int = 100) -> Graph:
+    """G(n, m): m distinct edges drawn uniformly at random, no self-loops."""
+    limit = n * (n - 1) // (1 if directed else 2)
+    if m > limit:
+        raise ValueError(f"G({n}, m) holds at most {limit} edges.")
+    rng = random.Random(seed)
+    g = _empty(n, directed)
+    added = 0
+    while added < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v and v not in g.neighbors(u):
+            g.add_edge(u, v, rng.randint(1, max_weight)); added += 1
+    return g
+
+def barabasi_albert(n: int, k: int, seed: Optional[int] = None, max_weight: int = 100) -> Graph:
+    """Preferential attachment: each new node links to k distinct existing nodes, chosen by degree."""
+    if not 1 <= k < n:
+        raise ValueError("barabasi_albert needs 1 <= k < n.")
+    rng = random.Random(seed)
+    g = _empty(n, False)
+    ends: List[int] = list(range(k))  # every edge endpoint once, so sampling it is degree-biased
+    for u in range(k, n):
+        targets = set()
+        while len(targets) < k:
+            targets.add(rng.choice(ends))
+        for v in targets:
+            g.add_edge(u, v, rng.randint(1, max_weight))
+            ends.append(u); ends.append(v)
+    return g
+
+def grid_graph(rows: int, cols: int, seed: Optional[int] = None, max_weight: int = 100,
+               drop: float = 0.0) -> Graph:
+    """Road-like 2D grid: node r*cols + c links to its right and lower neighbours; drop removes a random fraction."""
+    rng = random.Random(seed)
+    g = _empty(rows * cols, False)
+    for r in range(rows):
+        for c in range(cols):
+            u = r * cols + c
+            if c + 1 < cols and rng.random() >= drop:
+                g.add_edge(u, u + 1, rng.randint(1, max_weight))
+            if r + 1 < rows and rng.random() >= drop:
+                g.add_edge(u, u + cols, rng.randint(1, max_weight))
+    return g
+
+def random_dag(n: int, m: int, seed: Optional[int] = None, max_weight: int = 100) -> Graph:
+    """m distinct edges, each pointing forward in a hidden random topological order."""
+    if m > n * (n - 1) // 2:
+        raise ValueError(f"A DAG on {n} nodes holds at most {n * (n - 1) // 2} edges.")
+    rng = random.Random(seed)
+    rank = list(range(n)); rng.shuffle(rank)
+    g = _empty(n, True)
+    added = 0
+    while added < m:
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a == b:
+            continue
+        u, v = (rank[a], rank[b]) if a < b else (rank[b], rank[a])
+        if v not in g.neighbors(u):
+            g.add_edge(u, v, rng.randint(1, max_weight)); added += 1
+    return g
+
+def complete_graph(n: int, directed: bool = False, seed: Optional[int] = None, max_weight: int = 100) -> Graph:
+    rng = random.Random(seed)
+    g = _empty(n, directed)
+    for u in range(n):
+        for v in range(n) if directed else range(u + 1, n):
+            if u != v:
+                g.add_edge(u, v, rng.randint(1, max_weight))
+    return g
+
+def graph_for_edges(family: str, m: int, seed: Optional[int] = None) -> Graph:
+    """A graph of the given family sized to roughly m edges (average degree about 8 where free)."""
+    if family == "er":
+        return erdos_renyi(max(m // 4, 8), m, seed=seed)
+    if family == "ba":
+        return barabasi_albert(max(m // 4, 8), 4, seed=seed)
+    if family == "grid":
+        side = max(int(math.isqrt(m // 2)), 2)
+        return grid_graph(side, side, seed=seed)
+    if family == "dag":
+        return random_dag(max(m // 4, 8), m, seed=seed)
+    if family == "complete":
+        return complete_graph(max(int((1 + math.sqrt(1 + 8 * m)) / 2), 2), seed=seed)
+    raise ValueError(f"Unknown graph family {family!r}.")
+
+def main():
+    print("=== Seeded generators ===")
+    for family in ("er", "ba", "grid", "dag", "complete"):
+        g = graph_for_edges(family, 1000, seed=0)
+        print(family, g, len(g.edges()), "edges")
+
+if __name__ == "__main__":
+    main()
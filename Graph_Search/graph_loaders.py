@@ -0,0 +1,277 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from concurrent.futures import Future, ProcessPoolExecutor
+from collections import deque
+import io
+import os
+from graph_base import Graph, CSRGraph
+
+try:
+    import numpy as np
+except ImportError:  # blocks are parsed with vectorized NumPy text conversion
+    np = None
+
+BLOCK_BYTES = 1 << 26
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("The graph file loaders require NumPy.")
+
+def _block_ranges(path: str, start: int, block_bytes: int) -> List[Tuple[int, int]]:
+    # Byte ranges of about block_bytes each, cut just after a newline.
+    size = os.path.getsize(path)
+    ranges: List[Tuple[int, int]] = []
+    with open(path, "rb") as f:
+        lo = start
+        while lo < size:
+            f.seek(min(lo + block_bytes, size))
+            if f.tell() < size:
+                f.readline()
+            ranges.append((lo, f.tell())); lo = f.tell()
+    return ranges
+
+def _read(path: str, lo: int, hi: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(lo)
+        return f.read(hi - lo)
+
+def _drop_lines(block: bytes, prefixes: Tuple[bytes, ...]) -> bytes:
+    if not any(block.startswith(p) or b"\n" + p in block for p in prefixes):
+        return block
+    return b"\n".join(line for line in block.split(b"\n") if not line.startswith(prefixes))
+
+def _tokens(block: bytes, delimiter: Optional[bytes] = None):
+    # Whitespace (or delimiter) separated fields as a bytes array; callers check the count.
+    if delimiter is not None:
+        block = block.replace(delimiter, b" ")
+    return np.array(block.split(), dtype=bytes)
+
+def _convert(tokens, dtype):
+    # Ids go through int64 directly (no float64 round trip, so values past 2**53 survive);
+    # only weight columns are parsed as float64.
+    try:
+        return tokens.astype(dtype)
+    except (ValueError, OverflowError):
+        raise ValueError("Malformed numeric graph data.") from None
+
+def _columns(block: bytes, weighted: bool, delimiter: Optional[bytes] = None):
+    # u, v as int64 and w as float64 straight from the text (NumPy's C row parser checks every
+    # row's field count and conversion); later columns are ignored.
+    if not block.strip():
+        return np.empty(0, np.int64), np.empty(0, np.int64), (np.empty(0) if weighted else None)
+    names = ("u", "v", "w") if weighted else ("u", "v")
+    dtype = np.dtype([(c, np.int64) for c in names[:2]] + [("w", np.float64)] * weighted)
+    try:
+        rows = np.loadtxt(io.BytesIO(block), dtype=dtype, delimiter=delimiter.decode() if delimiter else None,
+                          comments=None, usecols=range(len(names)), ndmin=1, encoding="latin-1")
+    except ValueError as e:
+        raise ValueError(f"Malformed numeric graph data: {e}") from None
+    return rows["u"], rows["v"], (rows["w"] if weighted else None)
+
+def _map_blocks(fn: Callable, path: str, start: int, block_bytes: int, workers: int, *args) -> Iterator[Any]:
+    """Applies fn(path, lo, hi, *args) to every block in file order, optionally in worker processes."""
+    ranges = _block_ranges(path, start, block_bytes)
+    if workers <= 1 or len(ranges) <= 1:
+        for lo, hi in ranges:
+            yield fn(path, lo, hi, *args)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: "deque[Future]" = deque()
+        for lo, hi in ranges:
+            pending.append(pool.submit(fn, path, lo, hi, *args))
+            if len(pending) >= 2 * workers:  # bound the parsed blocks held in memory
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _parse_edgelist(path: str, lo: int, hi: int, ncols: int, delimiter: Optional[bytes],
+                    comments: Tuple[bytes, ...], int_ids: bool):
+    block = _drop_lines(_read(path, lo, hi), comments)
+    if int_ids:
+        return (None,) + _columns(block, ncols > 2, delimiter)
+    tokens = _tokens(block, delimiter)
+    if tokens.size % ncols:
+        raise ValueError("Edge list rows have an inconsistent number of columns.")
+    rows = tokens.reshape(-1, ncols)
+    w = _convert(rows[:, 2], np.float64) if ncols > 2 else None
+    if rows.shape[0] == 0:
+        return [], np.empty(0, np.int64), np.empty(0, np.int64), (np.empty(0) if ncols > 2 else None)
+    # Intern per block: one np.unique over the endpoint tokens, ids in first-seen order.
+    uniq, first, inv = np.unique(rows[:, :2].ravel(), return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty(uniq.size, dtype=np.int64); rank[order] = np.arange(uniq.size)
+    ids = rank[inv.ravel()].reshape(-1, 2)
+    names = [x.decode() for x in uniq[order].tolist()]
+    return names, ids[:, 0], ids[:, 1], w
+
+def _parse_dimacs(path: str, lo: int, hi: int):
+    block = _read(path, lo, hi)
+    if not block.startswith(b"a") or b"\nc" in block or b"\np" in block:
+        block = b"\n".join(line for line in block.split(b"\n") if line.startswith(b"a"))
+    src, dst, w = _columns(block.replace(b"a", b" "), True)
+    return src - 1, dst - 1, w
+
+def _parse_metis(path: str, lo: int, hi: int, lead: int, weighted: bool):
+    block = _read(path, lo, hi)
+    lines = [line for line in block.split(b"\n") if not line.startswith(b"%")]
+    if block.endswith(b"\n"):
+        lines.pop()
+    counts = np.fromiter((len(line.split()) for line in lines), dtype=np.int64, count=len(lines))
+    vals = _tokens(b" ".join(lines))
+    if (counts < lead).any():
+        raise ValueError("METIS adjacency line is missing its vertex weight columns.")
+    if lead:
+        # Drop the per-vertex size/weight columns at the start of each line.
+        keep = np.ones(vals.size, dtype=bool)
+        starts = np.cumsum(counts) - counts
+        for j in range(lead):
+            keep[starts + j] = False
+        vals, counts = vals[keep], counts - lead
+    if weighted:
+        if (counts % 2).any():
+            raise ValueError("METIS adjacency line has a neighbour without a weight.")
+        return counts // 2, _convert(vals[0::2], np.int64) - 1, _convert(vals[1::2], np.float64)
+    return counts, _convert(vals, np.int64) - 1, None
+
+def _build(labels: Sequence[Any], src, dst, w, directed: bool, as_csr: bool) -> Union[Graph, CSRGraph]:
+    if w is None:
+        w = np.ones(src.size)
+    if as_csr:
+        return CSRGraph.from_arrays(labels, src, dst, w, directed)
+    g = Graph(directed=directed)
+    for x in labels:
+        g.add_node(x)
+    g.add_edges_from(zip(map(labels.__getitem__, src.tolist()), map(labels.__getitem__, dst.tolist()), w.tolist()))
+    return g
+
+def _concat(parts: List[Any], dtype) -> Any:
+    return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+def _first_data_line(path: str, skip: Callable[[bytes], bool]) -> Tuple[Optional[bytes], int]:
+    # First line not rejected by skip, and the byte offset just past it.
+    with open(path, "rb") as f:
+        for line in iter(f.readline, b""):
+            if not skip(line):
+                return line, f.tell()
+    return None, os.path.getsize(path)
+
+def read_edgelist(path: str, directed: bool = False, delimiter: Optional[str] = None, comments: str = "#",
+                  header: bool = False, int_ids: bool = False, as_csr: bool = True, workers: int = 1,
+                  block_bytes: int = BLOCK_BYTES) -> Union[Graph, CSRGraph]:
+    """
+    Load a TSV/CSV/whitespace edge list (u v [w ...] per line) in blocks of about block_bytes.
+    Columns past the third are ignored; a missing weight column means weight 1.
+    Labels are interned as strings in first-seen order. With int_ids=True the columns are
+    parsed as int64 and taken as node ids 0..max directly when they are dense (0 <= id < twice
+    the endpoint count); sparse ids such as hashes become sorted int labels instead. workers > 1 parses blocks in that many processes.
+    """
+    _require_numpy()
+    delim = delimiter.encode() if delimiter is not None and delimiter.strip() else None
+    prefixes = tuple(c.encode() for c in comments)
+    is_comment = lambda line: not line.strip() or line.startswith(prefixes)
+    first, after = _first_data_line(path, is_comment)
+    if first is None:
+        return _build([], np.empty(0, np.int64), np.empty(0, np.int64), None, directed, as_csr)
+    ncols = len(first.replace(delim, b" ").split() if delim else first.split())
+    if ncols < 2:
+        raise ValueError("Edge list rows need at least two columns.")
+    start = after if header else 0
+    index: Dict[Any, int] = {}
+    srcs, dsts, wts = [], [], []
+    for names, s, d, w in _map_blocks(_parse_edgelist, path, start, block_bytes, workers,
+                                      ncols, delim, prefixes, int_ids):
+        if names is not None:
+            remap = np.fromiter((index.setdefault(x, len(index)) for x in names), dtype=np.int64, count=len(names))
+            s, d = remap[s], remap[d]
+        srcs.append(s); dsts.append(d)
+        if w is not None: wts.append(w)
+    src, dst = _concat(srcs, np.int64), _concat(dsts, np.int64)
+    if int_ids and src.size:
+        lo, hi = int(min(src.min(), dst.min())), int(max(src.max(), dst.max()))
+        if lo >= 0 and hi < 2 * (src.size + dst.size):
+            labels: Sequence[Any] = range(hi + 1)
+        else:  # sparse, hashed or negative ids: intern them, keeping the int values as labels
+            ids = np.unique(np.concatenate((src, dst)))
+            labels = ids.tolist()
+            src, dst = np.searchsorted(ids, src), np.searchsorted(ids, dst)
+    elif int_ids:
+        labels = range(0)
+    else:
+        labels = list(index)
+    return _build(labels, src, dst, _concat(wts, np.float64) if ncols > 2 else None, directed, as_csr)
+
+def read_dimacs(path: str, directed: bool = True, as_csr: bool = True, workers: int = 1,
+                block_bytes: int = BLOCK_BYTES) -> Union[Graph, CSRGraph]:
+    """Load a DIMACS shortest-path file (.gr: 'p sp n m', then 'a u v w'); nodes become ids 0..n-1."""
+    _require_numpy()
+    line, after = _first_data_line(path, lambda line: not line.startswith(b"p"))
+    if line is None or len(line.split()) < 4:
+        raise ValueError("DIMACS file has no 'p sp n m' problem line.")
+    n = int(line.split()[2])
+    parts = list(_map_blocks(_parse_dimacs, path, after, block_bytes, workers))
+    src = _concat([p[0] for p in parts], np.int64)
+    dst = _concat([p[1] for p in parts], np.int64)
+    w = _concat([p[2] for p in parts], np.float64)
+    if src.size and (min(src.min(), dst.min()) < 0 or max(src.max(), dst.max()) >= n):
+        raise ValueError("DIMACS arc endpoint outside 1..n.")
+    return _build(range(n), src, dst, w, directed, as_csr)
+
+def read_metis(path: str, as_csr: bool = True, workers: int = 1,
+               block_bytes: int = BLOCK_BYTES) -> Union[Graph, CSRGraph]:
+    """
+    Load a METIS graph file ('n m [fmt [ncon]]' header, then one adjacency line per vertex,
+    1-based). Edge weights are read when fmt ends in 1; vertex sizes/weights are skipped.
+    The graph is undirected with nodes 0..n-1.
+    """
+    _require_numpy()
+    line, after = _first_data_line(path, lambda line: line.startswith(b"%"))
+    if line is None:
+        raise ValueError("METIS file has no header line.")
+    head = line.split()
+    n, m = int(head[0]), int(head[1])
+    fmt = head[2].decode().rjust(3, "0") if len(head) > 2 else "000"
+    ncon = int(head[3]) if len(head) > 3 else 1
+    lead = (fmt[0] == "1") + (ncon if fmt[1] == "1" else 0)
+    weighted = fmt[2] == "1"
+    rows = entries = 0
+    srcs, dsts, wts = [], [], []
+    for counts, nbr, w in _map_blocks(_parse_metis, path, after, block_bytes, workers, lead, weighted):
+        src = np.repeat(np.arange(rows, rows + counts.size, dtype=np.int64), counts)
+        rows += counts.size; entries += nbr.size
+        keep = src < nbr  # every edge is listed from both ends
+        srcs.append(src[keep]); dsts.append(nbr[keep])
+        if w is not None: wts.append(w[keep])
+    if rows != n:
+        raise ValueError(f"METIS file has {rows} adjacency lines but the header says {n} vertices.")
+    kept = sum(s.size for s in srcs)
+    if entries != 2 * m or kept != m:
+        raise ValueError(f"METIS file lists {entries} adjacency entries ({kept} edges) but the header says {m} edges.")
+    return _build(range(n), _concat(srcs, np.int64), _concat(dsts, np.int64),
+                  _concat(wts, np.float64) if weighted else None, False, as_csr)
+
+def main():
+    import tempfile
+    if np is None:
+        print("NumPy is required for the graph file loaders.")
+        return
+    d = tempfile.mkdtemp()
+    print("=== Edge list (TSV, interned labels) ===")
+    p = os.path.join(d, "g.tsv")
+    with open(p, "w") as f:
+        f.write("# u\tv\tw\nA\tB\t4\nA\tC\t2\nB\tC\t1\nB\tD\t5\nC\tD\t8\nD\tZ\t6\n")
+    g = read_edgelist(p, delimiter="\t")
+    print(g, g.nodes(), dict(g.neighbors("B").items()))
+
+    print("=== DIMACS .gr ===")
+    p = os.path.join(d, "g.gr")
+    with open(p, "w") as f:
+        f.write("c sample\np sp 3 3\na 1 2 7\na 2 3 1\na 1 3 9\n")
+    print(read_dimacs(p).edges())
+
+    print("=== METIS (edge-weighted) ===")
+    p = os.path.join(d, "g.metis")
+    with open(p, "w") as f:
+        f.write("% triangle plus an isolated vertex\n4 3 001\n2 1 3 2\n1 1 3 5\n1 2 2 5\n\n")
+    print(read_metis(p, as_csr=False).edges())
+
+if __name__ == "__main__":
+    main()
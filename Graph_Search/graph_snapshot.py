@@ -0,0 +1,148 @@
+from typing import Any, List, Sequence, Union
+from array import array
+import mmap as _mmap
+import struct
+import sys
+from graph_base import Graph, CSRGraph
+from common_utils import sample_symmetric_graph
+
+# Layout (little-endian, every section 8-byte aligned):
+#   header   magic, version, flags, index itemsize, n, m, label offset, label length (padded to 64 bytes)
+#   indptr   int64[n + 1]
+#   indices  int32/int64[m]
+#   weights  float64[m]
+#   labels   label table (absent when the labels are exactly 0..n-1): a tag byte padded to 8,
+#            then int64[n] for int labels, or uint64[n + 1] offsets plus UTF-8 text for str labels
+# Nothing in the file is unpickled or executed; any other label type is rejected on save.
+MAGIC = b"GRAPHCSR"
+VERSION = 2
+_HEADER = struct.Struct("<8sHBBqqqq")
+_HEADER_SIZE = 64
+_DIRECTED, _RANGE_LABELS = 1, 2
+_INT_LABELS, _STR_LABELS = 1, 2
+
+def _align(x: int) -> int:
+    return (x + 7) // 8 * 8
+
+def _raw(buf: Sequence, typecode: str) -> memoryview:
+    mv = memoryview(buf)
+    if mv.format != typecode or not mv.c_contiguous:
+        mv = memoryview(array(typecode, buf))
+    return mv.cast("B")
+
+def _encode_labels(labels: Sequence[Any]) -> bytes:
+    """Label table for int or str labels (one type throughout), see the layout above."""
+    if all(type(x) is int for x in labels):
+        try:
+            return bytes([_INT_LABELS]).ljust(8, b"\0") + array("q", labels).tobytes()
+        except OverflowError:
+            raise ValueError("Integer labels must fit in int64.") from None
+    if all(type(x) is str for x in labels):
+        text = [x.encode("utf-8") for x in labels]
+        ends = array("Q", [0])
+        for t in text:
+            ends.append(ends[-1] + len(t))
+        return bytes([_STR_LABELS]).ljust(8, b"\0") + ends.tobytes() + b"".join(text)
+    raise ValueError("Snapshot labels must be all int or all str.")
+
+def _decode_labels(raw: memoryview, n: int) -> List[Any]:
+    """Inverse of _encode_labels; raises ValueError on anything malformed."""
+    raw = raw.cast("B")
+    if len(raw) < 8:
+        raise ValueError("Not a graph snapshot (bad label table).")
+    tag, body = raw[0], raw[8:]
+    if tag == _INT_LABELS and len(body) == 8 * n:
+        return body.cast("q").tolist()
+    if tag == _STR_LABELS and len(body) >= 8 * (n + 1):
+        ends = body[:8 * (n + 1)].cast("Q").tolist()
+        text = bytes(body[8 * (n + 1):])
+        if ends[0] == 0 and ends[-1] == len(text) and all(a <= b for a, b in zip(ends, ends[1:])):
+            try:
+                return [text[a:b].decode("utf-8") for a, b in zip(ends, ends[1:])]
+            except UnicodeDecodeError:
+                pass
+    raise ValueError("Not a graph snapshot (bad label table).")
+
+def _pack_sections(sections: Sequence[bytes]) -> bytes:
+    # Length-prefixed byte sections, for the smaller index files (landmarks, hierarchies).
+    return b"".join(struct.pack("<Q", len(sec)) + sec for sec in sections)
+
+def _unpack_sections(data: memoryview, off: int, count: int) -> List[memoryview]:
+    out = []
+    for _ in range(count):
+        if off + 8 > len(data):
+            raise ValueError("Truncated index file.")
+        (size,) = struct.unpack_from("<Q", data, off); off += 8
+        if off + size > len(data):
+            raise ValueError("Truncated index file.")
+        out.append(data[off:off + size]); off += size
+    return out
+
+def save_graph(graph: Union[Graph, CSRGraph], path: str) -> None:
+    """Write graph (a Graph is frozen to CSR first) as a versioned binary snapshot."""
+    if sys.byteorder != "little":
+        raise ValueError("Graph snapshots are written on little-endian hosts only.")
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    labels = csr._labels
+    n, m = csr.num_nodes, len(csr.indices)
+    isize = memoryview(csr.indices).itemsize
+    sections = [_raw(csr.indptr, "q"), _raw(csr.indices, "i" if isize == 4 else "q"), _raw(csr.weights, "d")]
+    range_labels = isinstance(labels, range) or all(type(x) is int and x == i for i, x in enumerate(labels))
+    blob = b"" if range_labels else _encode_labels(labels)
+    offset = _HEADER_SIZE + sum(_align(s.nbytes) for s in sections)
+    flags = (_DIRECTED if csr.directed else 0) | (_RANGE_LABELS if range_labels else 0)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, flags, isize, n, m, offset, len(blob)).ljust(_HEADER_SIZE, b"\0"))
+        for s in sections:
+            f.write(s); f.write(b"\0" * (_align(s.nbytes) - s.nbytes))
+        f.write(blob)
+
+def load_graph(path: str, mmap: bool = True) -> CSRGraph:
+    """
+    Open a snapshot as a read-only CSRGraph. With mmap=True the CSR arrays are typed
+    views straight into the mapped file: nothing is parsed or copied, pages load on
+    first touch and are shared by every process mapping the same file.
+    Only the label table is decoded (and skipped entirely for 0..n-1 labels); every
+    section length is checked against the file size before anything is viewed.
+    """
+    with open(path, "rb") as f:
+        buf: Any = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ) if mmap else f.read()
+    view = memoryview(buf)
+    if len(view) < _HEADER_SIZE:
+        raise ValueError("Not a graph snapshot (file too short).")
+    magic, version, flags, isize, n, m, loff, llen = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Not a graph snapshot (bad magic).")
+    if version != VERSION:
+        raise ValueError(f"Unsupported graph snapshot version {version}.")
+    if sys.byteorder != "little":
+        raise ValueError("Graph snapshots can only be loaded on little-endian hosts.")
+    if isize not in (4, 8) or n < 0 or m < 0 or loff < 0 or llen < 0:
+        raise ValueError("Not a graph snapshot (bad header).")
+    sections = (("q", n + 1, 8), ("i" if isize == 4 else "q", m, isize), ("d", m, 8))
+    end = _HEADER_SIZE + sum(_align(count * size) for _, count, size in sections)
+    if end > len(view) or loff + llen > len(view) or (not flags & _RANGE_LABELS and loff < end):
+        raise ValueError("Not a graph snapshot (truncated or inconsistent sections).")
+    off = _HEADER_SIZE
+    arrays: List[memoryview] = []
+    for typecode, count, size in sections:
+        arrays.append(view[off:off + count * size].cast(typecode))
+        off += _align(count * size)
+    if arrays[0][0] != 0 or arrays[0][n] != m:
+        raise ValueError("Not a graph snapshot (inconsistent indptr).")
+    labels = range(n) if flags & _RANGE_LABELS else _decode_labels(view[loff:loff + llen], n)
+    return CSRGraph(bool(flags & _DIRECTED), labels, *arrays)
+
+def main():
+    import os, tempfile
+    print("=== Snapshot round trip (memory-mapped) ===")
+    g = sample_symmetric_graph()
+    path = os.path.join(tempfile.mkdtemp(), "graph.csr")
+    g.save(path)
+    csr = CSRGraph.load(path)
+    print(csr, os.path.getsize(path), "bytes")
+    print(dict(csr.neighbors("A").items()))
+    print(sorted(csr.edges()) == sorted(CSRGraph.from_graph(g).edges()))
+
+if __name__ == "__main__":
+    main()
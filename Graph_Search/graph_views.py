@@ -0,0 +1,305 @@
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from graph_base import Graph, CSRGraph
+from common_utils import sample_symmetric_graph, sample_directed_graph_general
+
+EdgePredicate = Callable[[Any, Any, float], bool]
+
+class _FilteredNeighbors(Mapping):
+    """Neighbor mapping of a base mapping with keep(v, w) applied on every access; nothing is copied."""
+    __slots__ = ("_base", "_keep")
+
+    def __init__(self, base: Mapping, keep: Callable[[Any, float], bool]) -> None:
+        self._base = base; self._keep = keep
+
+    def __getitem__(self, v: Any) -> float:
+        w = self._base[v]
+        if not self._keep(v, w):
+            raise KeyError(v)
+        return w
+
+    def __contains__(self, v: Any) -> bool:
+        return v in self._base and self._keep(v, self._base[v])
+
+    def __iter__(self) -> Iterator[Any]:
+        return (v for v, _ in self.items())
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.items())
+
+    def keys(self):
+        return self.__iter__()
+
+    def values(self):
+        return (w for _, w in self.items())
+
+    def items(self):
+        keep = self._keep
+        return ((v, w) for v, w in self._base.items() if keep(v, w))
+
+
+class GraphView:
+    """
+    Read-only view over a Graph, CSRGraph or another view. It shares the base adjacency,
+    reflects later changes to the base, and filters lazily inside neighbors()/predecessors().
+    Exposes the read API the search algorithms use (directed, nodes, neighbors,
+    predecessors, edges, ...), so bfs, dijkstra and friends run on it unchanged.
+    """
+    def __init__(self, base: Any) -> None:
+        self._base = base
+
+    @property
+    def directed(self) -> bool:
+        return self._base.directed
+
+    @property
+    def version(self) -> int:
+        return getattr(self._base, "version", 0)
+
+    def _out(self, u: Any) -> Mapping:
+        return self._base.neighbors(u)
+
+    def _in(self, u: Any) -> Mapping:
+        return self._base.predecessors(u)
+
+    def neighbors(self, u: Any) -> Mapping:
+        return self._out(u)
+
+    def predecessors(self, u: Any) -> Mapping:
+        return self._in(u) if self.directed else self._out(u)
+
+    def nodes(self) -> List[Any]:
+        return self._base.nodes()
+
+    def iter_edges(self) -> Iterator[Tuple[Any, Any, float]]:
+        nodes = self.nodes()
+        if self.directed:
+            for u in nodes:
+                for v, w in self.neighbors(u).items():
+                    yield (u, v, w)
+            return
+        order = {u: i for i, u in enumerate(nodes)}
+        for u in nodes:
+            ou = order[u]
+            for v, w in self.neighbors(u).items():
+                if ou <= order[v]:
+                    yield (u, v, w)
+
+    def edges(self) -> List[Tuple[Any, Any, float]]:
+        return list(self.iter_edges())
+
+    def undirected_view_neighbors(self, u: Any):
+        out = self.neighbors(u)
+        yield from out.items()
+        if self.directed:
+            for x, w in self.predecessors(u).items():
+                if x != u and x not in out:
+                    yield (x, w)
+
+    def subgraph(self, nodes: Iterable[Any]) -> "GraphView":
+        return SubgraphView(self, nodes)
+
+    def edge_filter(self, pred: EdgePredicate) -> "GraphView":
+        return EdgeFilterView(self, pred)
+
+    def reverse(self) -> "GraphView":
+        return ReverseView(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._base!r})"
+
+
+class SubgraphView(GraphView):
+    """Induced subgraph on a node subset (nodes missing from the base are ignored)."""
+    def __init__(self, base: Any, nodes: Iterable[Any]) -> None:
+        super().__init__(base)
+        self._keep = frozenset(nodes)
+        inside = self._keep.__contains__
+        self._keep_nbr = lambda v, w: inside(v)
+
+    def _out(self, u: Any) -> Mapping:
+        return _FilteredNeighbors(self._base.neighbors(u), self._keep_nbr) if u in self._keep else {}
+
+    def _in(self, u: Any) -> Mapping:
+        return _FilteredNeighbors(self._base.predecessors(u), self._keep_nbr) if u in self._keep else {}
+
+    def nodes(self) -> List[Any]:
+        keep = self._keep
+        return [u for u in self._base.nodes() if u in keep]
+
+
+class EdgeFilterView(GraphView):
+    """Keeps the edges (u, v, w) for which pred(u, v, w) is true, evaluated on access."""
+    def __init__(self, base: Any, pred: EdgePredicate) -> None:
+        super().__init__(base)
+        self._pred = pred
+
+    def _out(self, u: Any) -> Mapping:
+        pred = self._pred
+        return _FilteredNeighbors(self._base.neighbors(u), lambda v, w: pred(u, v, w))
+
+    def _in(self, u: Any) -> Mapping:
+        pred = self._pred
+        return _FilteredNeighbors(self._base.predecessors(u), lambda x, w: pred(x, u, w))
+
+
+class ReverseView(GraphView):
+    """Every edge flipped; for undirected graphs this is the graph itself."""
+    def _out(self, u: Any) -> Mapping:
+        return self._base.predecessors(u)
+
+    def _in(self, u: Any) -> Mapping:
+        return self._base.neighbors(u)
+
+
+class _MaskedCSRNeighbors(Mapping):
+    """One CSR row seen through a node mask (by id) and an edge mask (by arc position)."""
+    __slots__ = ("_g", "_lo", "_hi", "_ix", "_wt", "_nm", "_em")
+
+    def __init__(self, g: CSRGraph, lo: int, hi: int, ix: Sequence[int], wt: Sequence[float],
+                 node_mask: Optional[bytearray], edge_mask: Optional[Sequence[int]]) -> None:
+        self._g = g; self._lo = lo; self._hi = hi; self._ix = ix; self._wt = wt
+        self._nm = node_mask; self._em = edge_mask
+
+    def _live(self, e: int) -> bool:
+        return (self._nm is None or self._nm[self._ix[e]]) and (self._em is None or self._em[e])
+
+    def _find(self, v: Any) -> int:
+        vid = self._g._index.get(v)
+        if vid is None:
+            return -1
+        i = bisect_left(self._ix, vid, self._lo, self._hi)
+        return i if i < self._hi and self._ix[i] == vid and self._live(i) else -1
+
+    def __getitem__(self, v: Any) -> float:
+        i = self._find(v)
+        if i < 0:
+            raise KeyError(v)
+        return self._wt[i]
+
+    def __contains__(self, v: Any) -> bool:
+        return self._find(v) >= 0
+
+    def __iter__(self) -> Iterator[Any]:
+        return (v for v, _ in self.items())
+
+    def __len__(self) -> int:
+        return sum(1 for e in range(self._lo, self._hi) if self._live(e))
+
+    def keys(self):
+        return self.__iter__()
+
+    def values(self):
+        return (w for _, w in self.items())
+
+    def items(self):
+        lab, ix, wt, nm, em = self._g._labels, self._ix, self._wt, self._nm, self._em
+        for e in range(self._lo, self._hi):
+            x = ix[e]
+            if (nm is None or nm[x]) and (em is None or em[e]):
+                yield lab[x], wt[e]
+
+
+class CSRMaskedView(GraphView):
+    """
+    Subgraph / edge-filter view of a CSRGraph held as masks: a bytearray over node ids
+    and a 0/1 sequence over arc positions (e.g. a NumPy bool array built from
+    csr.to_numpy()), instead of per-edge predicate calls. subgraph() and edge_filter()
+    with a mask AND into new masks, so chained filters stay one view deep.
+    """
+    def __init__(self, csr: CSRGraph, node_mask: Optional[bytearray] = None,
+                 edge_mask: Optional[Sequence[int]] = None) -> None:
+        super().__init__(csr)
+        if edge_mask is not None and len(edge_mask) != len(csr.indices):
+            raise ValueError("edge_mask needs one entry per CSR arc.")
+        self._csr = csr
+        self._nm = node_mask
+        self._em = edge_mask
+        self._rem: Optional[Sequence[int]] = None
+
+    def _row(self, u: Any, reverse: bool) -> Mapping:
+        csr = self._csr
+        i = csr._index.get(u)
+        if i is None or (self._nm is not None and not self._nm[i]):
+            return {}
+        if not reverse:
+            return _MaskedCSRNeighbors(csr, csr.indptr[i], csr.indptr[i + 1], csr.indices, csr.weights, self._nm, self._em)
+        rptr, rix, rwt = csr._reverse()
+        return _MaskedCSRNeighbors(csr, rptr[i], rptr[i + 1], rix, rwt, self._nm, self._reverse_mask())
+
+    def _reverse_mask(self) -> Optional[Sequence[int]]:
+        # The edge mask permuted into reverse-CSR arc order (built once, on first use).
+        if self._em is None or self._rem is not None:
+            return self._rem
+        csr = self._csr
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            order = np.argsort(csr.to_numpy()[1], kind="stable")  # same order as CSRGraph._reverse
+            self._rem = np.asarray(self._em, dtype=bool)[order]
+            return self._rem
+        rptr = csr._reverse()[0]
+        pos = array("q", rptr[:-1])
+        rem = bytearray(len(csr.indices))
+        ip, ix = csr.indptr, csr.indices
+        for u in range(csr.num_nodes):
+            for e in range(ip[u], ip[u + 1]):
+                v = ix[e]
+                rem[pos[v]] = 1 if self._em[e] else 0; pos[v] += 1
+        self._rem = rem
+        return rem
+
+    def _out(self, u: Any) -> Mapping:
+        return self._row(u, False)
+
+    def _in(self, u: Any) -> Mapping:
+        return self._row(u, True)
+
+    def nodes(self) -> List[Any]:
+        if self._nm is None:
+            return self._csr.nodes()
+        lab = self._csr._labels
+        return [lab[i] for i, keep in enumerate(self._nm) if keep]
+
+    def subgraph(self, nodes: Iterable[Any]) -> "GraphView":
+        mask = bytearray(self._csr.num_nodes)
+        for u in nodes:
+            i = self._csr._index.get(u)
+            if i is not None and (self._nm is None or self._nm[i]):
+                mask[i] = 1
+        return CSRMaskedView(self._csr, mask, self._em)
+
+    def edge_filter(self, pred: Union[EdgePredicate, Sequence[int]]) -> "GraphView":
+        if callable(pred):
+            return EdgeFilterView(self, pred)
+        mask = pred if self._em is None else bytearray(1 if a and b else 0 for a, b in zip(self._em, pred))
+        return CSRMaskedView(self._csr, self._nm, mask)
+
+def view(graph: Union[Graph, CSRGraph]) -> GraphView:
+    """Unfiltered view; CSR graphs get the mask-based view so later filters stay masks."""
+    return CSRMaskedView(graph) if isinstance(graph, CSRGraph) else GraphView(graph)
+
+def main():
+    from dijkstra import dijkstra
+    print("=== Subgraph view (no copy) on symmetric graph ===")
+    g = sample_symmetric_graph()
+    sub = g.subgraph(["A", "B", "C", "D"])
+    print(sub.nodes(), dict(sub.neighbors("C").items()), dijkstra(sub, "A")[0])
+
+    print("=== Edge filter (weight < 5) and reverse on directed graph ===")
+    d = sample_directed_graph_general()
+    light = d.edge_filter(lambda u, v, w: w < 5)
+    print(light.edges(), light.reverse().edges())
+
+    print("=== Mask-based views on the CSR form ===")
+    csr = CSRGraph.from_graph(g)
+    heavy_free = csr.edge_filter([1 if w < 5 else 0 for w in csr.weights])
+    print(heavy_free.subgraph(["A", "B", "C", "D", "E"]).edges())
+
+if __name__ == "__main__":
+    main()
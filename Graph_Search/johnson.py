@@ -0,0 +1,41 @@
+from typing import Any, Dict
+from graph_base import Graph
+from bellman_ford import _spfa
+from dijkstra import dijkstra
+from common_utils import sample_symmetric_graph, sample_directed_graph_general
+
+INF = float("inf")
+
+def johnson(graph: Graph) -> Dict[Any, Dict[Any, float]]:
+    """
+    All-pairs shortest paths for sparse graphs with negative edges.
+    Potentials h come from SPFA started at every node (a virtual source with 0-weight
+    edges); every edge is reweighted to w + h(u) - h(v) >= 0 and dijkstra runs per node.
+    Raises NegativeCycleError (a ValueError) with a witness cycle.
+    """
+    nodes = graph.nodes()
+    h, _ = _spfa(graph, nodes)
+    reweighted: Graph = Graph(directed=graph.directed)
+    for u in nodes: reweighted.add_node(u)
+    for u in nodes:
+        for v, w in graph.neighbors(u).items():
+            # Clamp float round-off so dijkstra never sees a tiny negative weight.
+            reweighted.add_edge(u, v, max(0.0, w + h[u] - h[v]))
+    out: Dict[Any, Dict[Any, float]] = {}
+    for u in nodes:
+        d, _ = dijkstra(reweighted, u)
+        out[u] = {v: (dv - h[u] + h[v] if dv != INF else INF) for v, dv in d.items()}
+    return out
+
+def main():
+    print("=== Johnson on symmetric graph ===")
+    g = sample_symmetric_graph()
+    print(johnson(g)["A"]["Z"])
+
+    print("=== Johnson on directed graph with a rebate edge ===")
+    d = sample_directed_graph_general()
+    d.add_edge("B", "D", -4)
+    print(johnson(d)["A"])
+
+if __name__ == "__main__":
+    main()
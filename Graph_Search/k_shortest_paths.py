@@ -0,0 +1,166 @@
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from itertools import islice
+import heapq
+from graph_base import Graph
+from dijkstra import dijkstra, _search_to_target, INF
+from common_utils import sample_symmetric_graph, sample_directed_graph_general
+
+def _tree_to(graph: Graph, target: Any) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    # Distance from every node to target and the next hop on one shortest path there.
+    return dijkstra(graph.reverse(), target)
+
+def _tree_path(nxt: Dict[Any, Optional[Any]], u: Any) -> List[Any]:
+    path = [u]
+    while nxt[u] is not None:
+        u = nxt[u]; path.append(u)
+    return path
+
+def yen_k_shortest_paths(graph: Graph, source: Any, target: Any) -> Iterator[Tuple[float, List[Any]]]:
+    """
+    Loopless paths from source to target in nondecreasing cost (Yen), yielded lazily.
+    One reverse Dijkstra gives exact distances to target. Those distances serve as the A*
+    heuristic for every spur search. When a spur node's own shortest path to target
+    avoids all removed nodes and edges, it is reused as the spur path without searching.
+    Lawler's rule only spurs a new path from its deviation index onward.
+    """
+    to_t, nxt = _tree_to(graph, target)
+    if to_t.get(source, INF) == INF:
+        return
+    first = _tree_path(nxt, source)
+    accepted: List[List[Any]] = []
+    candidates: List[Tuple[float, int, List[Any], int]] = [(to_t[source], 0, first, 0)]
+    seen: Set[Tuple[Any, ...]] = {tuple(first)}
+    seq = 1
+    h = to_t.__getitem__
+    while candidates:
+        cost, _, path, dev = heapq.heappop(candidates)
+        accepted.append(path)
+        yield cost, path
+        prefix = 0.0
+        prefix_cost = [0.0]
+        for a, b in zip(path, path[1:]):
+            prefix += graph.neighbors(a)[b]; prefix_cost.append(prefix)
+        for i in range(dev, len(path) - 1):
+            spur, root = path[i], path[:i + 1]
+            banned_next = {p[i + 1] for p in accepted if len(p) > i + 1 and p[:i + 1] == root}
+            banned = set(root[:-1])
+            tree = _tree_path(nxt, spur)
+            if tree[1:2] and tree[1] not in banned_next and banned.isdisjoint(tree):
+                d, spur_path = to_t[spur], tree
+            else:
+                def neighbors(u: Any, spur: Any = spur, banned_next: Set[Any] = banned_next, banned: Set[Any] = banned):
+                    for v, w in graph.neighbors(u).items():
+                        if v not in banned and not (u == spur and v in banned_next):
+                            yield v, w
+                d, spur_path = _search_to_target(neighbors, spur, target, h)
+            if not spur_path:
+                continue
+            full = root[:-1] + spur_path
+            key = tuple(full)
+            if key not in seen:
+                seen.add(key)
+                heapq.heappush(candidates, (prefix_cost[i] + d, seq, full, i)); seq += 1
+
+class _HeapNode:
+    """Node of a persistent leftist heap of sidetracks (delta, x, y); melds copy only the right spine."""
+    __slots__ = ("delta", "x", "y", "rank", "left", "right")
+
+    def __init__(self, delta: float, x: Any, y: Any, rank: int,
+                 left: Optional["_HeapNode"], right: Optional["_HeapNode"]) -> None:
+        self.delta = delta; self.x = x; self.y = y; self.rank = rank; self.left = left; self.right = right
+
+def _meld(a: Optional[_HeapNode], b: Optional[_HeapNode]) -> Optional[_HeapNode]:
+    # Neither input is modified, so a heap can be shared as the tail of many others.
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if b.delta < a.delta:
+        a, b = b, a
+    left, right = a.left, _meld(a.right, b)
+    if left is None or left.rank < right.rank:
+        left, right = right, left
+    return _HeapNode(a.delta, a.x, a.y, (right.rank if right is not None else 0) + 1, left, right)
+
+def eppstein_k_shortest_paths(graph: Graph, source: Any, target: Any) -> Iterator[Tuple[float, List[Any]]]:
+    """
+    Source->target walks (repeated nodes allowed) in nondecreasing cost, yielded lazily.
+    Every walk is the shortest-path tree toward target plus a sequence of sidetracks.
+    A sidetrack is a non-tree edge (x, y), and its cost is w + d(y) - d(x).
+    As in Eppstein, each node gets a persistent heap of every sidetrack leaving its tree
+    path to target: its own sidetracks melded into its tree parent's heap, which is
+    shared rather than copied (O(log V) new nodes per tree node). A candidate walk is a
+    heap node plus the sidetracks chosen before it; its children swap that node for
+    one of its two heap children, or append the best sidetrack reachable after it.
+    Heaps are built on first use, so only the tree paths the enumeration touches pay.
+    """
+    to_t, nxt = _tree_to(graph, target)
+    if to_t.get(source, INF) == INF:
+        return
+    heaps: Dict[Any, Optional[_HeapNode]] = {}
+
+    def along(v: Any) -> Optional[_HeapNode]:
+        # Heap of every sidetrack leaving a node on the tree path v -> target.
+        start, chain = v, []
+        while v is not None and v not in heaps:
+            chain.append(v); v = nxt[v]
+        for x in reversed(chain):
+            own = sorted((w + to_t[y] - to_t[x], y) for y, w in graph.neighbors(x).items()
+                         if y != nxt[x] and to_t[y] != INF)
+            h = heaps[nxt[x]] if nxt[x] is not None else None
+            if own:
+                tail = None
+                for delta, y in reversed(own):  # a sorted chain is already a leftist heap
+                    tail = _HeapNode(delta, x, y, 1, tail, None)
+                h = _meld(tail, h)
+            heaps[x] = h
+        return heaps[start]
+
+    def walk(chosen: Optional[Tuple[Any, ...]]) -> List[Any]:
+        hops: List[Tuple[Any, Any]] = []
+        while chosen is not None:
+            chosen, x, y = chosen; hops.append((x, y))
+        path: List[Any] = []
+        u = source
+        for x, y in reversed(hops):
+            while u != x:
+                path.append(u); u = nxt[u]
+            path.append(x); u = y
+        return path + _tree_path(nxt, u)
+
+    base = to_t[source]
+    yield base, _tree_path(nxt, source)
+    # (cost, seq, heap node holding the last sidetrack, sidetracks chosen before it)
+    heap: List[Tuple[float, int, _HeapNode, Optional[Tuple[Any, ...]]]] = []
+    seq = 0
+    root = along(source)
+    if root is not None:
+        heap.append((base + root.delta, seq, root, None)); seq += 1
+    while heap:
+        cost, _, node, prev = heapq.heappop(heap)
+        chosen = (prev, node.x, node.y)
+        yield cost, walk(chosen)
+        for child in (node.left, node.right):
+            if child is not None:
+                heapq.heappush(heap, (cost - node.delta + child.delta, seq, child, prev)); seq += 1
+        after = along(node.y)
+        if after is not None:
+            heapq.heappush(heap, (cost + after.delta, seq, after, chosen)); seq += 1
+
+def k_shortest_paths(graph: Graph, source: Any, target: Any, k: int, simple: bool = True) -> List[Tuple[float, List[Any]]]:
+    """The k cheapest source->target paths: loopless (Yen) by default, or any walks (Eppstein)."""
+    gen = yen_k_shortest_paths if simple else eppstein_k_shortest_paths
+    return list(islice(gen(graph, source, target), k))
+
+def main():
+    print("=== Yen: 4 loopless paths A->Z on symmetric graph ===")
+    g = sample_symmetric_graph()
+    for cost, path in k_shortest_paths(g, "A", "Z", 4):
+        print(cost, path)
+    print("=== Eppstein: 4 walks A->D on directed graph (cycles allowed) ===")
+    d = sample_directed_graph_general()
+    for cost, path in k_shortest_paths(d, "A", "D", 4, simple=False):
+        print(cost, path)
+
+if __name__ == "__main__":
+    main()
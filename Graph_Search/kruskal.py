@@ -1,4 +1,5 @@
 from typing import Any, Dict, List, Tuple
+from operator import itemgetter
 from graph_base import Graph
 from common_utils import sample_symmetric_graph, sample_directed_graph_general
 
@@ -29,7 +30,7 @@ def kruskal_mst(graph: Graph) -> List[Tuple[Any, Any, float]]:
         raise ValueError("Kruskal's MST is defined for undirected (symmetric) graphs.")
     ds = DisjointSet()
     for u in graph.nodes(): ds.find(u)
-    edges = sorted(graph.edges(), key=lambda e: e[2])
+    edges = sorted(graph.iter_edges(), key=itemgetter(2))
     out: List[Tuple[Any, Any, float]] = []
     for u, v, w in edges:
         if ds.union(u, v):
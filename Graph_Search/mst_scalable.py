@@ -0,0 +1,149 @@
+from typing import Any, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+import os
+from graph_base import Graph, CSRGraph
+from shared_arrays import SharedSpec, attach_arrays, share_arrays
+from union_find_components import ArrayDisjointSet
+from common_utils import sample_symmetric_graph, sample_directed_graph_general
+
+try:
+    import numpy as np
+except ImportError:  # both engines work on NumPy edge arrays
+    np = None
+
+def edge_arrays(graph: Union[Graph, CSRGraph]):
+    """Undirected edges as (labels, src, dst, weight) arrays, each edge once, self-loops dropped."""
+    if np is None:
+        raise ImportError("The scalable MST engines require NumPy.")
+    if graph.directed:
+        raise ValueError("MST is defined for undirected (symmetric) graphs.")
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    indptr, indices, weights = csr.to_numpy()
+    src = np.repeat(np.arange(csr.num_nodes, dtype=np.int64), np.diff(indptr))
+    keep = src < indices
+    return csr.nodes(), src[keep], indices[keep].astype(np.int64), weights[keep]
+
+def _kruskal_base(ds: ArrayDisjointSet, src, dst, w, ids, out: List[int]) -> None:
+    for e in ids[np.argsort(w[ids], kind="stable")].tolist():
+        if ds.union(int(src[e]), int(dst[e])):
+            out.append(e)
+
+def filter_kruskal_mst(graph: Union[Graph, CSRGraph], base_size: int = 4096,
+                       seed: Optional[int] = None) -> List[Tuple[Any, Any, float]]:
+    """
+    Filter-Kruskal: quicksort-style partitioning of the edges around a sampled pivot
+    weight. The light half is solved first; the heavy half is then filtered, dropping
+    every edge whose endpoints are already connected, before it is partitioned or sorted.
+    """
+    labels, src, dst, w = edge_arrays(graph)
+    rng = np.random.default_rng(seed)
+    ds = ArrayDisjointSet(len(labels))
+    picked: List[int] = []
+    stack = [np.arange(len(src), dtype=np.int64)]
+    while stack:
+        ids = stack.pop()
+        if len(picked) == len(labels) - 1:
+            break
+        if ids.size and picked:
+            ids = ids[ds.find_many(src[ids]) != ds.find_many(dst[ids])]
+        if ids.size <= base_size:
+            _kruskal_base(ds, src, dst, w, ids, picked)
+            continue
+        pivot = np.median(w[rng.choice(ids, size=min(ids.size, 1024), replace=False)])
+        light = w[ids] <= pivot
+        if light.all() or not light.any():
+            _kruskal_base(ds, src, dst, w, ids, picked)
+            continue
+        stack.append(ids[~light]); stack.append(ids[light])
+    return [(labels[src[e]], labels[dst[e]], float(w[e])) for e in picked]
+
+# Per-process views of the shared edge ranks and component roots, set by _attach.
+_shared: Optional[Tuple[Any, List[memoryview], Any, List[memoryview]]] = None
+
+def _attach(edge_spec: SharedSpec, root_spec: SharedSpec) -> None:
+    global _shared
+    _shared = attach_arrays(edge_spec) + attach_arrays(root_spec)
+
+def _cheapest(src, dst, rank, roots, lo: int, hi: int):
+    # Cheapest (lowest global rank) outgoing edge per component over edges lo..hi.
+    cu, cv = roots[src[lo:hi]], roots[dst[lo:hi]]
+    live = cu != cv
+    comps = np.concatenate((cu[live], cv[live]))
+    ranks = np.concatenate((rank[lo:hi][live], rank[lo:hi][live]))
+    if comps.size == 0:
+        return comps, ranks
+    order = np.lexsort((ranks, comps))
+    comps, ranks = comps[order], ranks[order]
+    first = np.ones(comps.size, dtype=bool); first[1:] = comps[1:] != comps[:-1]
+    return comps[first], ranks[first]
+
+def _cheapest_task(bounds: Tuple[int, int]):
+    _, (src, dst, rank), _, (roots,) = _shared
+    return _cheapest(np.frombuffer(src, dtype=np.int64), np.frombuffer(dst, dtype=np.int64),
+                     np.frombuffer(rank, dtype=np.int64), np.frombuffer(roots, dtype=np.int64), *bounds)
+
+def boruvka_mst(graph: Union[Graph, CSRGraph], workers: Optional[int] = None,
+                chunk_size: int = 1 << 20) -> List[Tuple[Any, Any, float]]:
+    """
+    Borůvka rounds on array-backed edges: every component picks its cheapest outgoing
+    edge (ties broken by edge order), all picks are merged, and rounds repeat until no
+    edge crosses components. With workers > 1 the per-round scan is split across a
+    process pool that reads the edges and current roots from shared memory.
+    """
+    labels, src, dst, w = edge_arrays(graph)
+    n, m = len(labels), len(src)
+    order = np.lexsort((np.arange(m), w))
+    rank = np.empty(m, dtype=np.int64); rank[order] = np.arange(m)
+    ds = ArrayDisjointSet(n)
+    picked: List[int] = []
+    workers = workers or os.cpu_count() or 1
+    pool = roots_view = None
+    shms: List[Any] = []
+    try:
+        if workers > 1 and m > chunk_size:
+            edge_shm, edge_spec = share_arrays([src, dst, rank]); shms.append(edge_shm)
+            root_shm, root_spec = share_arrays([np.arange(n, dtype=np.int64)]); shms.append(root_shm)
+            roots_view = np.frombuffer(root_shm.buf, dtype=np.int64, count=n)
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_attach, initargs=(edge_spec, root_spec))
+        bounds = [(lo, min(lo + chunk_size, m)) for lo in range(0, m, chunk_size)]
+        while len(picked) < n - 1:
+            roots = ds.find_many(np.arange(n))
+            if pool is not None:
+                roots_view[:] = roots
+                parts = list(pool.map(_cheapest_task, bounds))
+            else:
+                parts = [_cheapest(src, dst, rank, roots, lo, hi) for lo, hi in bounds]
+            best = np.full(n, m, dtype=np.int64)
+            for comps, ranks in parts:
+                np.minimum.at(best, comps, ranks)
+            chosen = np.unique(best[best < m])
+            if chosen.size == 0:
+                break
+            for e in order[chosen].tolist():
+                if ds.union(int(src[e]), int(dst[e])):
+                    picked.append(e)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        roots_view = None  # release the buffer export before closing
+        for shm in shms:
+            shm.close(); shm.unlink()
+    return [(labels[src[e]], labels[dst[e]], float(w[e])) for e in picked]
+
+def main():
+    if np is None:
+        print("NumPy is required for the scalable MST engines.")
+        return
+    print("=== Filter-Kruskal on symmetric graph ===")
+    g = sample_symmetric_graph()
+    print(filter_kruskal_mst(g))
+    print("=== Borůvka on symmetric graph ===")
+    print(boruvka_mst(g, workers=1))
+    print("=== Borůvka on directed graph (should raise) ===")
+    try:
+        print(boruvka_mst(sample_directed_graph_general()))
+    except Exception as e:
+        print("Not applicable:", e)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import heapq
+import os
+from graph_base import Graph, CSRGraph
+from shared_arrays import SharedSpec, attach_arrays, share_csr
+from common_utils import sample_symmetric_graph, sample_directed_graph_general
+
+INF = float("inf")
+
+def csr_dijkstra(indptr: Sequence[int], indices: Sequence[int], weights: Sequence[float],
+                 source: int) -> Tuple[array, array]:
+    """Dijkstra over raw CSR buffers; returns (dist, parent) arrays indexed by node id (parent -1 = none)."""
+    n = len(indptr) - 1
+    dist = array("d", [INF]) * n
+    parent = array("q", [-1]) * n
+    dist[source] = 0.0
+    pq: List[Tuple[float, int]] = [(0.0, source)]
+    while pq:
+        du, u = heapq.heappop(pq)
+        if du > dist[u]:
+            continue
+        for e in range(indptr[u], indptr[u + 1]):
+            w = weights[e]
+            if w < 0:
+                raise ValueError("Dijkstra requires non-negative weights.")
+            v = indices[e]
+            alt = du + w
+            if alt < dist[v]:
+                dist[v] = alt; parent[v] = u; heapq.heappush(pq, (alt, v))
+    return dist, parent
+
+# Per-process view of the shared CSR snapshot, set by _attach.
+_shared: Optional[Tuple[Any, List[memoryview]]] = None
+
+def _attach(spec: SharedSpec) -> None:
+    global _shared
+    _shared = attach_arrays(spec)
+
+def _run(source: int) -> Tuple[int, bytes, bytes]:
+    indptr, indices, weights = _shared[1]
+    dist, parent = csr_dijkstra(indptr, indices, weights, source)
+    return source, dist.tobytes(), parent.tobytes()
+
+def _to_dicts(csr: CSRGraph, dist: array, parent: array) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    labels = csr.nodes()
+    return (dict(zip(labels, dist)),
+            {u: (labels[p] if p >= 0 else None) for u, p in zip(labels, parent)})
+
+def multi_source_dijkstra(graph: Union[Graph, CSRGraph], sources: Iterable[Any], workers: Optional[int] = None
+                          ) -> Iterator[Tuple[Any, Dict[Any, float], Dict[Any, Optional[Any]]]]:
+    """
+    Runs an independent dijkstra from every source and yields (source, dist, parent)
+    as each run finishes. With workers > 1 the runs are spread over a process pool that
+    shares one CSR snapshot through shared memory instead of pickling the graph per task.
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    ids = [csr.index_of(s) for s in sources]
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(ids) <= 1:
+        for s in ids:
+            dist, parent = csr_dijkstra(csr.indptr, csr.indices, csr.weights, s)
+            yield (csr.label_of(s),) + _to_dicts(csr, dist, parent)
+        return
+    shm, spec = share_csr(csr)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach, initargs=(spec,)) as pool:
+            pending = set()
+            it = iter(ids)
+            # Keep a bounded number of runs in flight so results stream instead of piling up.
+            for s in it:
+                pending.add(pool.submit(_run, s))
+                if len(pending) >= 2 * workers:
+                    break
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    s, raw_dist, raw_parent = fut.result()
+                    dist, parent = array("d"), array("q")
+                    dist.frombytes(raw_dist); parent.frombytes(raw_parent)
+                    nxt = next(it, None)
+                    if nxt is not None:
+                        pending.add(pool.submit(_run, nxt))
+                    yield (csr.label_of(s),) + _to_dicts(csr, dist, parent)
+    finally:
+        shm.close(); shm.unlink()
+
+def all_sources_dijkstra(graph: Union[Graph, CSRGraph], workers: Optional[int] = None
+                         ) -> Iterator[Tuple[Any, Dict[Any, float], Dict[Any, Optional[Any]]]]:
+    return multi_source_dijkstra(graph, graph.nodes(), workers=workers)
+
+def main():
+    print("=== All-sources Dijkstra on symmetric graph (2 workers) ===")
+    g = sample_symmetric_graph()
+    for s, dist, _ in sorted(all_sources_dijkstra(g, workers=2), key=lambda r: str(r[0])):
+        print(s, dist)
+
+    print("=== Multi-source Dijkstra on directed graph (serial) ===")
+    d = sample_directed_graph_general()
+    for s, dist, _ in multi_source_dijkstra(d, ["A", "C"], workers=1):
+        print(s, dist)
+
+if __name__ == "__main__":
+    main()
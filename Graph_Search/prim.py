@@ -1,8 +1,15 @@
-from typing import Any, List, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
 import heapq
 from graph_base import Graph
 from common_utils import sample_symmetric_graph, sample_directed_graph_general
 
+try:
+    import numpy as np
+except ImportError:  # the dense matrix mode falls back to a plain Python scan
+    np = None
+
+INF = float("inf")
+
 def prim_mst(graph: Graph) -> List[Tuple[Any, Any, float]]:
     if graph.directed:
         raise ValueError("Prim's MST is defined for undirected (symmetric) graphs.")
@@ -29,10 +36,202 @@ def prim_mst(graph: Graph) -> List[Tuple[Any, Any, float]]:
             add(v)
     return out
 
+class IndexedMinHeap:
+    """Binary min-heap with one entry per item and a position index for real decrease-key."""
+    def __init__(self) -> None:
+        self._items: List[Any] = []
+        self._key: Dict[Any, float] = {}
+        self._pos: Dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._pos
+
+    def key(self, item: Any) -> float:
+        return self._key[item]
+
+    def push_or_decrease(self, item: Any, key: float) -> bool:
+        """Inserts item, or lowers its key; returns False if the existing key is not larger."""
+        i = self._pos.get(item)
+        if i is None:
+            self._items.append(item); self._key[item] = key
+            self._pos[item] = len(self._items) - 1
+            self._sift_up(len(self._items) - 1)
+            return True
+        if key >= self._key[item]:
+            return False
+        self._key[item] = key
+        self._sift_up(i)
+        return True
+
+    def pop(self) -> Tuple[Any, float]:
+        items = self._items
+        top = items[0]
+        last = items.pop()
+        del self._pos[top]
+        if items:
+            items[0] = last; self._pos[last] = 0
+            self._sift_down(0)
+        return top, self._key.pop(top)
+
+    def _sift_up(self, i: int) -> None:
+        items, key, pos = self._items, self._key, self._pos
+        x = items[i]; kx = key[x]
+        while i > 0:
+            p = (i - 1) // 2
+            if key[items[p]] <= kx:
+                break
+            items[i] = items[p]; pos[items[i]] = i
+            i = p
+        items[i] = x; pos[x] = i
+
+    def _sift_down(self, i: int) -> None:
+        items, key, pos = self._items, self._key, self._pos
+        n = len(items)
+        x = items[i]; kx = key[x]
+        while True:
+            c = 2 * i + 1
+            if c >= n:
+                break
+            if c + 1 < n and key[items[c + 1]] < key[items[c]]:
+                c += 1
+            if key[items[c]] >= kx:
+                break
+            items[i] = items[c]; pos[items[i]] = i
+            i = c
+        items[i] = x; pos[x] = i
+
+def prim_mst_indexed(graph: Graph) -> List[Tuple[Any, Any, float]]:
+    """Prim with an indexed heap: one entry per frontier vertex, updated by decrease-key."""
+    if graph.directed:
+        raise ValueError("Prim's MST is defined for undirected (symmetric) graphs.")
+    visited: Set[Any] = set()
+    link: Dict[Any, Any] = {}
+    heap = IndexedMinHeap()
+    out: List[Tuple[Any, Any, float]] = []
+    for root in graph.nodes():
+        if root in visited:
+            continue
+        heap.push_or_decrease(root, 0.0)
+        while heap:
+            v, w = heap.pop()
+            visited.add(v)
+            if v != root:
+                out.append((link.pop(v), v, w))
+            for x, wx in graph.neighbors(v).items():
+                if x not in visited and heap.push_or_decrease(x, wx):
+                    link[x] = v
+    return out
+
+Rows = Union[Sequence[Sequence[float]], Callable[[int], Sequence[float]]]
+
+def prim_mst_dense(weights: Union[Graph, Rows], n: Optional[int] = None) -> List[Tuple[Any, Any, float]]:
+    """
+    O(V^2) array-based Prim for dense inputs: no heap, just a key array scanned per step.
+    weights is an undirected Graph, an n x n distance matrix, or a callable row(i) giving
+    the distances from i to all n nodes (so complete graphs never need a full matrix).
+    Missing edges are inf. Matrix/row results use node indices.
+    """
+    if isinstance(weights, Graph):
+        if weights.directed:
+            raise ValueError("Prim's MST is defined for undirected (symmetric) graphs.")
+        return _prim_dense_graph(weights)
+    row = weights if callable(weights) else weights.__getitem__
+    if n is None:
+        if callable(weights):
+            raise ValueError("n is required when weights is a row callable.")
+        n = len(weights)
+    out: List[Tuple[Any, Any, float]] = []
+    if n == 0:
+        return out
+    if np is not None:
+        key = np.full(n, INF); link = np.full(n, -1, dtype=np.int64)
+        done = np.zeros(n, dtype=bool)
+        for _ in range(n):
+            cand = np.where(done, INF, key)
+            u = int(np.argmin(cand))
+            if cand[u] == INF:
+                u = int(np.argmin(done))  # next component root of the forest
+            elif link[u] >= 0:
+                out.append((int(link[u]), u, float(key[u])))
+            done[u] = True
+            r = np.asarray(row(u), dtype=np.float64)
+            better = (r < key) & ~done
+            key[better] = r[better]; link[better] = u
+        return out
+    key = [INF] * n; link = [-1] * n; done = [False] * n
+    for _ in range(n):
+        u, best = -1, INF
+        for i in range(n):
+            if not done[i] and (u < 0 or key[i] < best):
+                u, best = i, key[i]
+        if best != INF and link[u] >= 0:
+            out.append((link[u], u, best))
+        done[u] = True
+        for i, w in enumerate(row(u)):
+            if not done[i] and w < key[i]:
+                key[i] = w; link[i] = u
+    return out
+
+def _prim_dense_graph(graph: Graph) -> List[Tuple[Any, Any, float]]:
+    # Nodes are mapped to ids once (the cached CSR form); each step is an argmin over the
+    # key vector plus a vectorized update from u's CSR row, O(V^2 + E) in array passes.
+    csr = graph.to_csr()
+    n = csr.num_nodes
+    labels = csr.nodes()
+    out: List[Tuple[Any, Any, float]] = []
+    if n == 0:
+        return out
+    if np is None:
+        ip, ix, wt = csr.indptr, csr.indices, csr.weights
+        key = [INF] * n; link = [-1] * n; done = [False] * n
+        for _ in range(n):
+            u, best = -1, INF
+            for i in range(n):
+                if not done[i] and (u < 0 or key[i] < best):
+                    u, best = i, key[i]
+            if best != INF and link[u] >= 0:
+                out.append((labels[link[u]], labels[u], best))
+            done[u] = True
+            for e in range(ip[u], ip[u + 1]):
+                v, w = ix[e], wt[e]
+                if not done[v] and w < key[v]:
+                    key[v] = w; link[v] = u
+        return out
+    ip, ix, wt = csr.to_numpy()
+    key = np.full(n, INF); link = np.full(n, -1, dtype=np.int64)
+    done = np.zeros(n, dtype=bool)
+    for _ in range(n):
+        u = int(np.argmin(key))  # settled nodes hold inf, so this is the cheapest open node
+        if key[u] == INF:
+            u = int(np.argmin(done))  # next component root of the forest
+        else:
+            out.append((labels[link[u]], labels[u], float(key[u])))
+        done[u] = True; key[u] = INF
+        nb, w = ix[ip[u]:ip[u + 1]], wt[ip[u]:ip[u + 1]]
+        better = (w < key[nb]) & ~done[nb]
+        key[nb[better]] = w[better]; link[nb[better]] = u
+    return out
+
+def prim_mst_auto(graph: Graph, dense_threshold: float = 0.25) -> List[Tuple[Any, Any, float]]:
+    """Uses the O(V^2) dense mode when edge density reaches dense_threshold, else the indexed heap."""
+    if graph.directed:
+        raise ValueError("Prim's MST is defined for undirected (symmetric) graphs.")
+    n = len(graph.nodes())
+    m = sum(len(graph.neighbors(u)) for u in graph.nodes()) / 2
+    if n > 1 and m / (n * (n - 1) / 2) >= dense_threshold:
+        return prim_mst_dense(graph)
+    return prim_mst_indexed(graph)
+
 def main():
     print("=== Prim on symmetric graph ===")
     g = sample_symmetric_graph()
     print(prim_mst(g))
+    print("=== Prim with indexed heap / dense O(V^2) mode ===")
+    print(prim_mst_indexed(g))
+    print(prim_mst_dense([[0, 2, 6], [2, 0, 3], [6, 3, 0]]))
     print("=== Prim on directed graph (should raise) ===")
     try:
         d = sample_directed_graph_general()
@@ -0,0 +1,71 @@
+from typing import Any, Dict, Iterator, List, Set, Tuple
+from graph_base import Graph
+from toposort_dfs import dfs_postorder
+from common_utils import sample_directed_graph_general, sample_directed_graph_acyclic
+
+def tarjan_scc(graph: Graph) -> Iterator[List[Any]]:
+    """Tarjan's SCCs with an explicit stack; components are yielded in reverse topological order."""
+    index: Dict[Any, int] = {}
+    low: Dict[Any, int] = {}
+    on_stack: Set[Any] = set()
+    stack: List[Any] = []
+    for root in graph.nodes():
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root); on_stack.add(root)
+        work: List[Tuple[Any, Iterator[Any]]] = [(root, iter(graph.neighbors(root)))]
+        while work:
+            u, it = work[-1]
+            for v in it:
+                if v not in index:
+                    index[v] = low[v] = len(index)
+                    stack.append(v); on_stack.add(v)
+                    work.append((v, iter(graph.neighbors(v))))
+                    break
+                if v in on_stack and index[v] < low[u]:
+                    low[u] = index[v]
+            else:
+                work.pop()
+                if work:
+                    p = work[-1][0]
+                    if low[u] < low[p]: low[p] = low[u]
+                if low[u] == index[u]:
+                    comp: List[Any] = []
+                    while True:
+                        x = stack.pop(); on_stack.discard(x); comp.append(x)
+                        if x == u:
+                            break
+                    yield comp
+
+def kosaraju_scc(graph: Graph) -> Iterator[List[Any]]:
+    """Kosaraju's SCCs: DFS finish order, then explicit-stack sweeps over predecessors."""
+    order = list(dfs_postorder(graph))
+    seen: Set[Any] = set()
+    for root in reversed(order):
+        if root in seen:
+            continue
+        seen.add(root)
+        comp: List[Any] = []
+        stack = [root]
+        while stack:
+            u = stack.pop()
+            comp.append(u)
+            for v in graph.predecessors(u):
+                if v not in seen:
+                    seen.add(v); stack.append(v)
+        yield comp
+
+def main():
+    print("=== Tarjan SCC on directed graph ===")
+    d = sample_directed_graph_general()
+    print(list(tarjan_scc(d)))
+
+    print("=== Kosaraju SCC on directed graph ===")
+    print(list(kosaraju_scc(d)))
+
+    print("=== SCCs of a DAG are singletons ===")
+    print(list(tarjan_scc(sample_directed_graph_acyclic())))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+from typing import List, Sequence, Tuple
+from array import array
+from multiprocessing import shared_memory
+from graph_base import CSRGraph
+
+# (shared memory name, [(byte offset, typecode, length), ...])
+SharedSpec = Tuple[str, List[Tuple[int, str, int]]]
+
+def _typecode(buf: Sequence) -> str:
+    return buf.typecode if isinstance(buf, array) else memoryview(buf).format
+
+def share_arrays(arrays: Sequence[Sequence]) -> Tuple[shared_memory.SharedMemory, SharedSpec]:
+    """Copy flat typed arrays into one shared-memory block; the caller closes and unlinks it."""
+    layout: List[Tuple[int, str, int]] = []
+    chunks = []
+    offset = 0
+    for a in arrays:
+        raw = memoryview(a).cast("B")
+        layout.append((offset, _typecode(a), len(a)))
+        chunks.append((offset, raw))
+        offset += (raw.nbytes + 7) // 8 * 8
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for off, raw in chunks:
+        shm.buf[off:off + raw.nbytes] = raw
+    return shm, (shm.name, layout)
+
+def attach_arrays(spec: SharedSpec) -> Tuple[shared_memory.SharedMemory, List[memoryview]]:
+    """Attach to a block made by share_arrays and return zero-copy typed views into it."""
+    name, layout = spec
+    shm = shared_memory.SharedMemory(name=name)
+    views = [shm.buf[off:off + length * array(tc).itemsize].cast(tc) for off, tc, length in layout]
+    return shm, views
+
+def share_csr(csr: CSRGraph) -> Tuple[shared_memory.SharedMemory, SharedSpec]:
+    return share_arrays([csr.indptr, csr.indices, csr.weights])
@@ -0,0 +1,189 @@
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+from collections import OrderedDict
+import heapq
+import sys
+import weakref
+from graph_base import Graph
+from dijkstra import dijkstra, INF
+from common_utils import sample_symmetric_graph
+
+_MISSING = object()
+
+class _Snapshot:
+    """
+    Copy-on-write record behind one get() result: the entry's live dicts plus the old
+    (dist, parent) of every key written since the result was handed out.
+    """
+    __slots__ = ("dist", "parent", "old", "added", "__weakref__")
+
+    def __init__(self, dist: Dict[Any, float], parent: Dict[Any, Optional[Any]]) -> None:
+        self.dist = dist; self.parent = parent
+        self.old: Dict[Any, Any] = {}  # key -> (dist, parent) before the first later write, or _MISSING
+        self.added = 0                 # keys written later that did not exist then
+
+class _SnapshotView(Mapping):
+    """Read-only dist (which=0) or parent (which=1) mapping as it was when get() returned."""
+    __slots__ = ("_snap", "_which")
+
+    def __init__(self, snap: _Snapshot, which: int) -> None:
+        self._snap = snap; self._which = which
+
+    def __getitem__(self, x: Any) -> Any:
+        snap = self._snap
+        old = snap.old.get(x)
+        if old is None:
+            return (snap.parent if self._which else snap.dist)[x]
+        if old is _MISSING:
+            raise KeyError(x)
+        return old[self._which]
+
+    def __iter__(self) -> Iterator[Any]:
+        old = self._snap.old
+        return (x for x in self._snap.dist if old.get(x) is not _MISSING)
+
+    def __len__(self) -> int:
+        return len(self._snap.dist) - self._snap.added
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+class _Entry:
+    __slots__ = ("version", "dist", "parent", "size", "snaps", "pending")
+
+    def __init__(self, version: int, dist: Dict[Any, float], parent: Dict[Any, Optional[Any]]) -> None:
+        self.version = version; self.dist = dist; self.parent = parent
+        self.size = sys.getsizeof(dist) + sys.getsizeof(parent)
+        self.snaps: "weakref.WeakSet[_Snapshot]" = weakref.WeakSet()
+        self.pending: List[Any] = []  # nodes added since the last get(); absent from dist means INF
+
+    def write(self, x: Any, d: float, p: Optional[Any]) -> None:
+        dist, parent = self.dist, self.parent
+        for snap in self.snaps:
+            if x not in snap.old:
+                if x in dist:
+                    snap.old[x] = (dist[x], parent[x])
+                else:
+                    snap.old[x] = _MISSING; snap.added += 1
+        dist[x] = d; parent[x] = p
+
+class SSSPCache:
+    """
+    LRU cache of dijkstra(graph, source) results keyed by (graph.version, source).
+    Listens to graph mutations: edge insertions and weight decreases are repaired
+    incrementally from the affected node; a weight increase evicts only the entries
+    whose shortest-path tree uses that edge; new nodes are added lazily (absent = INF).
+    Eviction happens past `capacity` entries or the approximate `max_bytes` budget.
+    get() returns read-only views that keep the values they had when returned: repairs
+    write the cached dicts in place and save a key's old value only for results still alive.
+    """
+    def __init__(self, graph: Graph, capacity: int = 128, max_bytes: Optional[int] = None) -> None:
+        self.graph = graph
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Any, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self.hits = self.misses = self.repairs = 0
+        graph.add_listener(self._on_mutation)
+
+    def close(self) -> None:
+        self.graph.remove_listener(self._on_mutation)
+        self.clear()
+
+    def clear(self) -> None:
+        self._entries.clear(); self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, source: Any) -> Tuple[Mapping[Any, float], Mapping[Any, Optional[Any]]]:
+        entry = self._entries.get(source)
+        if entry is not None and entry.version == self.graph.version:
+            self._entries.move_to_end(source)
+            self.hits += 1
+            if entry.pending:
+                for u in entry.pending:
+                    if u not in entry.dist:
+                        entry.write(u, INF, None)
+                entry.pending.clear()
+                self._resize(entry)
+        else:
+            self.misses += 1
+            if entry is not None:
+                self._drop(source)
+            entry = _Entry(self.graph.version, *dijkstra(self.graph, source))
+            self._entries[source] = entry
+            self._bytes += entry.size
+            self._evict()
+        snap = _Snapshot(entry.dist, entry.parent)
+        entry.snaps.add(snap)
+        return _SnapshotView(snap, 0), _SnapshotView(snap, 1)
+
+    def _resize(self, entry: _Entry) -> None:
+        size = sys.getsizeof(entry.dist) + sys.getsizeof(entry.parent)
+        self._bytes += size - entry.size; entry.size = size
+
+    def _drop(self, source: Any) -> None:
+        self._bytes -= self._entries.pop(source).size
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.capacity or
+                                 (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            self._drop(next(iter(self._entries)))
+
+    def _on_mutation(self, u: Any, v: Optional[Any], old: Optional[float], new: Optional[float]) -> None:
+        version = self.graph.version
+        if v is None:
+            for entry in self._entries.values():
+                if entry.version == version - 1:
+                    entry.pending.append(u); entry.version = version
+            return
+        if new < 0:
+            self.clear()
+            return
+        if old is not None and new > old:
+            # Distances only change if some tree path runs over u -> v (or v -> u).
+            for source in [s for s, e in self._entries.items() if e.parent.get(v) == u or
+                           (not self.graph.directed and e.parent.get(u) == v)]:
+                self._drop(source)
+            for entry in self._entries.values():
+                if entry.version == version - 1:
+                    entry.version = version
+            return
+        arcs = [(u, v)] if self.graph.directed else [(u, v), (v, u)]
+        for entry in self._entries.values():
+            if entry.version == version - 1:
+                self._repair(entry, arcs, new)
+                entry.version = version
+                self._resize(entry)
+        self._evict()
+        self.repairs += 1
+
+    def _repair(self, entry: _Entry, arcs: List[Tuple[Any, Any]], w: float) -> None:
+        # Only nodes whose distance improves through the new/cheaper arc are touched.
+        dist = entry.dist
+        pq: List[Tuple[float, Any]] = []
+        for a, b in arcs:
+            alt = dist.get(a, INF) + w
+            if alt < dist.get(b, INF):
+                entry.write(b, alt, a); heapq.heappush(pq, (alt, b))
+        while pq:
+            dx, x = heapq.heappop(pq)
+            if dx > dist[x]:
+                continue
+            for y, wy in self.graph.neighbors(x).items():
+                alt = dx + wy
+                if alt < dist.get(y, INF):
+                    entry.write(y, alt, x); heapq.heappush(pq, (alt, y))
+
+def main():
+    print("=== SSSP cache with incremental repair ===")
+    g = sample_symmetric_graph()
+    cache = SSSPCache(g, capacity=4)
+    print(cache.get("A")[0]["Z"])
+    g.add_edge("A", "E", 1)   # insertion: repaired incrementally
+    print(cache.get("A")[0]["Z"], "hits:", cache.hits, "misses:", cache.misses)
+    g.add_edge("A", "E", 7)   # weight increase on a tree edge: entry evicted
+    print(cache.get("A")[0]["Z"], "hits:", cache.hits, "misses:", cache.misses)
+
+if __name__ == "__main__":
+    main()
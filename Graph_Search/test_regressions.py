@@ -0,0 +1,152 @@
+# Regression checks for review findings; run with `python -m pytest -q` from Graph_Search.
+import pytest
+from graph_base import Graph
+
+np = pytest.importorskip("numpy")
+
+def test_blocked_floyd_warshall_predecessors_with_zero_weights():
+    from floyd_warshall import floyd_warshall, floyd_warshall_matrix, reconstruct_path
+    g = Graph(directed=False)
+    for u in range(4):
+        g.add_node(u)
+    for u, v, w in [(0, 2, 0), (0, 3, 3), (1, 3, 0)]:
+        g.add_edge(u, v, w)
+    ref = floyd_warshall(g)
+    nodes, dist, pred = floyd_warshall_matrix(g, block_size=2, predecessors=True)
+    for i in range(4):
+        for j in range(4):
+            assert dist[i, j] == ref[nodes[i]][nodes[j]]
+            path = reconstruct_path(pred, i, j)
+            assert path[0] == i and path[-1] == j
+            assert sum(g.neighbors(nodes[a])[nodes[b]] for a, b in zip(path, path[1:])) == dist[i, j]
+
+def test_reconstruct_path_rejects_cyclic_predecessors():
+    from floyd_warshall import reconstruct_path
+    pred = np.array([[-1, 2, 1], [-1, -1, -1], [-1, -1, -1]])
+    with pytest.raises(ValueError):
+        reconstruct_path(pred, 0, 1)
+
+def test_floyd_warshall_matrix_empty_graph():
+    from floyd_warshall import floyd_warshall_matrix
+    nodes, dist = floyd_warshall_matrix(Graph(directed=True), block_size=2)
+    assert nodes == [] and dist.shape == (0, 0)
+    assert floyd_warshall_matrix(Graph(directed=True), predecessors=True, as_dict=True) == ({}, {})
+
+def test_csr_graph_pickle_and_deepcopy_round_trip(tmp_path):
+    import copy, pickle
+    from graph_base import CSRGraph
+    built = [
+        CSRGraph.from_edges([("a", "b", 1.0), ("b", "c", 2.5), ("c", "a", 4.0)], directed=True),
+        CSRGraph.from_arrays(["x", "y", "z"], [0, 1, 1], [1, 2, 0], [1.0, 2.0, 3.0], directed=False),
+    ]
+    built[0].save(str(tmp_path / "g.csr"))
+    built.append(CSRGraph.load(str(tmp_path / "g.csr")))
+    for g in built:
+        g.predecessors(g.nodes()[0])  # builds the reverse index
+        for clone in (pickle.loads(pickle.dumps(g)), copy.deepcopy(g)):
+            assert clone.directed == g.directed and clone.nodes() == g.nodes()
+            assert clone.edges() == g.edges()
+            assert all(dict(clone.predecessors(u).items()) == dict(g.predecessors(u).items()) for u in g.nodes())
+
+def test_sssp_cache_results_are_snapshots():
+    from common_utils import sample_symmetric_graph
+    from dijkstra import dijkstra
+    from sssp_cache import SSSPCache
+    g = sample_symmetric_graph()
+    cache = SSSPCache(g)
+    dist, parent = cache.get("A")
+    before = dict(dist)
+    with pytest.raises(TypeError):
+        dist["Z"] = 0.0
+    g.add_edge("A", "E", 1)
+    g.add_edge("E", "NEW", 1)
+    assert dict(dist) == before
+    assert dict(cache.get("A")[0]) == dijkstra(g, "A")[0]
+    assert cache._bytes == sum(e.size for e in cache._entries.values())
+
+def test_sssp_cache_weight_increase_evicts_only_affected_trees():
+    from dijkstra import dijkstra
+    from sssp_cache import SSSPCache
+    g = Graph(directed=True)
+    g.add_edges_from([("a", "b", 1), ("b", "c", 1), ("a", "c", 5), ("c", "d", 1)])
+    cache = SSSPCache(g)
+    for s in ("a", "b", "c"):
+        cache.get(s)
+    g.add_edge("b", "c", 3)  # on the trees of a and b, not of c
+    assert list(cache._entries) == ["c"]
+    for s in ("a", "b", "c"):
+        assert dict(cache.get(s)[0]) == dijkstra(g, s)[0]
+
+def test_bottom_up_step_matches_full_in_edge_scan():
+    import random
+    from bfs import _bottom_up_step
+    from graph_base import CSRGraph
+    rng = random.Random(0)
+    n = 300
+    edges = [(rng.randrange(n), rng.randrange(n), 1.0) for _ in range(3000)]
+    rptr, rix, _ = CSRGraph.from_edges(edges, directed=True, nodes=range(n)).to_numpy(reverse=True)
+    in_frontier = np.zeros(n, dtype=bool); in_frontier[rng.sample(range(n), 20)] = True
+    candidates = np.flatnonzero(~in_frontier)
+    expected = [v for v in candidates if in_frontier[rix[rptr[v]:rptr[v + 1]]].any()]
+    for tail in (0, 5, 10 ** 6):  # all rounds, rounds then one gather, one gather
+        assert sorted(_bottom_up_step(rptr, rix, in_frontier, candidates, tail).tolist()) == expected
+
+def test_snapshot_labels_round_trip_without_pickle(tmp_path):
+    from graph_base import CSRGraph
+    for labels in (["a", "bé", "", "漢"], [5, -3, 2 ** 62, 7]):
+        g = Graph(directed=True)
+        for x in labels:
+            g.add_node(x)
+        g.add_edge(labels[0], labels[1], 2.5); g.add_edge(labels[3], labels[2], 1.0)
+        path = str(tmp_path / "g.csr")
+        g.save(path)
+        for mmap in (True, False):
+            csr = CSRGraph.load(path, mmap=mmap)
+            assert csr.nodes() == labels and sorted(map(str, csr.edges())) == sorted(map(str, g.edges()))
+    g = Graph(directed=False); g.add_edge((1, 2), (3, 4), 1.0)
+    with pytest.raises(ValueError):
+        g.save(str(tmp_path / "tuples.csr"))
+
+def test_truncated_snapshot_raises_value_error(tmp_path):
+    from graph_base import CSRGraph
+    from common_utils import sample_symmetric_graph
+    path = tmp_path / "g.csr"
+    sample_symmetric_graph().save(str(path))
+    data = path.read_bytes()
+    for cut in range(0, len(data), 7):
+        path.write_bytes(data[:cut])
+        for mmap in (True, False):
+            with pytest.raises(ValueError):
+                CSRGraph.load(str(path), mmap=mmap)
+
+def test_loaders_keep_large_int_ids_and_check_metis_edge_count(tmp_path):
+    from graph_loaders import read_edgelist, read_metis
+    ids = [2 ** 53 + 1, 2 ** 62 + 7, 12345678901234567]
+    path = tmp_path / "hashed.tsv"
+    path.write_text("".join(f"{ids[i]}\t{ids[(i + 1) % 3]}\t{i}.5\n" for i in range(3)))
+    g = read_edgelist(str(path), directed=True, delimiter="\t", int_ids=True)
+    assert sorted(g.nodes()) == sorted(ids)
+    assert sorted(g.edges()) == sorted((ids[i], ids[(i + 1) % 3], i + 0.5) for i in range(3))
+    path.write_text("0 1 2\n1 2\n")
+    with pytest.raises(ValueError):
+        read_edgelist(str(path), int_ids=True)
+    metis = tmp_path / "g.metis"
+    metis.write_text("3 2\n2 3\n1 3\n1 2\n")  # three edges listed, header claims two
+    with pytest.raises(ValueError):
+        read_metis(str(metis))
+
+def test_delta_stepping_pool_errors_are_not_masked(monkeypatch):
+    import delta_stepping
+    from dijkstra import dijkstra
+    from graph_generators import erdos_renyi
+    g = erdos_renyi(200, 800, seed=0)
+    assert delta_stepping.delta_stepping(g, 0, workers=2, parallel_threshold=1)[0] == dijkstra(g, 0)[0]
+    real, calls = delta_stepping._apply, []
+    def failing(*args):
+        calls.append(1)
+        if len(calls) == 3:
+            raise RuntimeError("relaxation failed")
+        return real(*args)
+    monkeypatch.setattr(delta_stepping, "_apply", failing)
+    with pytest.raises(RuntimeError, match="relaxation failed"):
+        delta_stepping.delta_stepping(g, 0, workers=2, parallel_threshold=1)
@@ -1,26 +1,60 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from graph_base import Graph
-from common_utils import sample_directed_graph_acyclic, sample_symmetric_graph
+from common_utils import sample_directed_graph_acyclic, sample_directed_graph_general, sample_symmetric_graph
+
+class CycleError(ValueError):
+    """Raised when a directed cycle blocks a topological order; .cycle is [c0, ..., c0]."""
+    def __init__(self, cycle: List[Any]) -> None:
+        super().__init__(f"Cycle detected: {cycle}")
+        self.cycle = cycle
+
+def _postorder(graph: Graph, on_cycle: str) -> Iterator[Any]:
+    # Explicit-stack DFS; each frame is (node, iterator over its remaining neighbors).
+    # on_cycle: "raise" reports the first back edge as ValueError, "ignore" skips it.
+    done: Set[Any] = set()
+    on_path: Dict[Any, int] = {}
+    for root in graph.nodes():
+        if root in done:
+            continue
+        on_path[root] = 0
+        work: List[Tuple[Any, Iterator[Any]]] = [(root, iter(graph.neighbors(root)))]
+        while work:
+            u, it = work[-1]
+            for v in it:
+                if v in done:
+                    continue
+                if v in on_path:
+                    if on_cycle == "raise":
+                        cycle = [node for node, _ in work[on_path[v]:]] + [v]
+                        raise CycleError(cycle)
+                    continue
+                on_path[v] = len(work)
+                work.append((v, iter(graph.neighbors(v))))
+                break
+            else:
+                work.pop()
+                del on_path[u]
+                done.add(u)
+                yield u
+
+def dfs_postorder(graph: Graph) -> Iterator[Any]:
+    """Yields nodes as their DFS finishes (reverse topological order on a DAG); no recursion."""
+    return _postorder(graph, "ignore")
+
+def find_cycle(graph: Graph) -> Optional[List[Any]]:
+    if not graph.directed:
+        raise ValueError("Cycle search here is defined for directed graphs only.")
+    try:
+        for _ in _postorder(graph, "raise"):
+            pass
+    except CycleError as e:
+        return e.cycle
+    return None
 
 def toposort_dfs(graph: Graph) -> List[Any]:
     if not graph.directed:
         raise ValueError("Topological sort is defined for directed acyclic graphs only.")
-    visited: Dict[Any, int] = {}
-    order: List[Any] = []
-    def visit(u: Any) -> None:
-        state = visited.get(u, 0)
-        if state == 1:
-            raise ValueError("Cycle detected")
-        if state == 2:
-            return
-        visited[u] = 1
-        for v in graph.neighbors(u).keys():
-            visit(v)
-        visited[u] = 2
-        order.append(u)
-    for u in graph.nodes():
-        if visited.get(u, 0) == 0:
-            visit(u)
+    order = list(_postorder(graph, "raise"))
     order.reverse()
     return order
 
@@ -28,6 +62,9 @@ def main():
     print("=== DFS Topo on directed DAG ===")
     dag = sample_directed_graph_acyclic()
     print(toposort_dfs(dag))
+    print("=== Cycle search on directed graph ===")
+    d = sample_directed_graph_general()
+    print(find_cycle(dag), find_cycle(d))
     print("=== DFS Topo on symmetric graph (should raise) ===")
     try:
         g = sample_symmetric_graph()
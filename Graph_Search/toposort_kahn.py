@@ -6,9 +6,7 @@ from common_utils import sample_directed_graph_acyclic, sample_symmetric_graph
 def toposort_kahn(graph: Graph) -> List[Any]:
     if not graph.directed:
         raise ValueError("Topological sort is defined for directed acyclic graphs only.")
-    indeg: Dict[Any, int] = {u: 0 for u in graph.nodes()}
-    for u, v, _ in graph.edges():
-        indeg[v] += 1
+    indeg: Dict[Any, int] = {u: len(graph.predecessors(u)) for u in graph.nodes()}
     q = deque([u for u, d in indeg.items() if d == 0])
     order: List[Any] = []
     while q:
@@ -0,0 +1,174 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from array import array
+from common_utils import sample_symmetric_graph
+
+try:
+    import numpy as np
+except ImportError:  # chunks are then unioned edge by edge
+    np = None
+
+class ArrayDisjointSet:
+    """
+    Union–Find over dense integer ids 0..n-1 with the parent links in one flat
+    int64 array. Roots are always the smallest id of their set, which lets edge
+    chunks be merged with vectorized min-label hooking when NumPy is present.
+    """
+    def __init__(self, n: int = 0) -> None:
+        self.parent = array("q", range(n))
+        self._flat = True  # every node points straight at its root
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def grow(self, n: int) -> None:
+        if n > len(self.parent):
+            self.parent.extend(range(len(self.parent), n))
+
+    def find(self, x: int) -> int:
+        p = self.parent
+        while p[x] != x:
+            p[x] = p[p[x]]  # path halving
+            x = p[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        if rb < ra:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self._flat = False
+        return True
+
+    def _flatten(self, P) -> None:
+        while True:
+            PP = P[P]
+            if np.array_equal(PP, P):
+                return
+            P[:] = PP
+
+    def union_chunk(self, src: Sequence[int], dst: Sequence[int]) -> None:
+        if np is None:
+            for a, b in zip(src, dst):
+                self.union(a, b)
+            return
+        src = np.asarray(src, dtype=np.int64); dst = np.asarray(dst, dtype=np.int64)
+        if src.size == 0:
+            return
+        self.grow(int(max(src.max(), dst.max())) + 1)
+        P = np.frombuffer(self.parent, dtype=np.int64)
+        if not self._flat:
+            self._flatten(P)
+        ru, rv = P[src], P[dst]
+        live = ru != rv
+        ru, rv = ru[live], rv[live]
+        while ru.size:
+            np.minimum.at(P, np.maximum(ru, rv), np.minimum(ru, rv))
+            # Only this round's roots were re-linked, so pointer doubling on them alone
+            # leaves ru/rv pointing at current roots again.
+            touched = np.concatenate((ru, rv))
+            while True:
+                nxt = P[P[touched]]
+                if np.array_equal(nxt, P[touched]):
+                    break
+                P[touched] = nxt
+            ru, rv = P[ru], P[rv]
+            live = ru != rv
+            ru, rv = ru[live], rv[live]
+        self._flatten(P)
+        del P
+        self._flat = True
+
+    def find_many(self, ids: Sequence[int]):
+        """Vectorized find for an array of ids (NumPy only); flattens the forest first if needed."""
+        P = np.frombuffer(self.parent, dtype=np.int64)
+        if not self._flat:
+            self._flatten(P)
+            self._flat = True
+        return P[np.asarray(ids, dtype=np.int64)]
+
+    def components(self) -> Tuple[Sequence[int], Sequence[int]]:
+        """Dense labels (ordered by each component's smallest id) and component sizes."""
+        if np is not None:
+            P = np.frombuffer(self.parent, dtype=np.int64)
+            if not self._flat:
+                self._flatten(P)
+                self._flat = True
+            _, labels, sizes = np.unique(P, return_inverse=True, return_counts=True)
+            return labels.astype(np.int64), sizes.astype(np.int64)
+        n = len(self.parent)
+        labels = array("q", [0]) * n
+        sizes = array("q")
+        for x in range(n):
+            r = self.find(x)
+            if r == x:
+                labels[x] = len(sizes); sizes.append(1)
+            else:
+                labels[x] = labels[r]; sizes[labels[r]] += 1
+        return labels, sizes
+
+def read_edge_chunks(path: str, chunk_lines: int = 1 << 20, delimiter: Optional[str] = None,
+                     comments: str = "#") -> Iterator[Tuple[Sequence[int], Sequence[int]]]:
+    """Streams an integer edge list (u v [w ...] per line) as (src, dst) chunks."""
+    with open(path, "r") as f:
+        while True:
+            lines = f.readlines(chunk_lines * 16)
+            if not lines:
+                return
+            src, dst = array("q"), array("q")
+            for line in lines:
+                if not line.strip() or line.startswith(comments):
+                    continue
+                parts = line.split(delimiter)
+                src.append(int(parts[0])); dst.append(int(parts[1]))
+            yield src, dst
+
+EdgeSource = Union[str, Iterable[Tuple[Any, ...]], Iterable[Tuple[Sequence[int], Sequence[int]]]]
+
+def stream_components(source: EdgeSource, num_nodes: int = 0, chunked: bool = False,
+                      intern: bool = False) -> Tuple[Sequence[int], Sequence[int], Optional[List[Any]]]:
+    """
+    Weak connected components over an edge stream that never has to fit in a Graph.
+    source is a file path (integer edge list), an iterable of (u, v[, w]) edges, or, with
+    chunked=True, an iterable of (src_ids, dst_ids) array pairs. With intern=True arbitrary
+    hashable labels are mapped to dense ids on the fly and the id->label list is returned.
+    Returns (labels, sizes, nodes): labels[i] is the component of node id i.
+    """
+    ds = ArrayDisjointSet(num_nodes)
+    index: Dict[Any, int] = {}
+    nodes: List[Any] = []
+    def intern_id(x: Any) -> int:
+        i = index.get(x)
+        if i is None:
+            i = index[x] = len(nodes); nodes.append(x)
+        return i
+    if isinstance(source, str):
+        source, chunked = read_edge_chunks(source), True
+    if chunked:
+        for src, dst in source:
+            if intern:
+                src = array("q", map(intern_id, src)); dst = array("q", map(intern_id, dst))
+            ds.union_chunk(src, dst)
+    else:
+        for e in source:
+            u, v = (intern_id(e[0]), intern_id(e[1])) if intern else (e[0], e[1])
+            ds.grow(max(u, v) + 1)
+            ds.union(u, v)
+    if intern:
+        ds.grow(len(nodes))
+    labels, sizes = ds.components()
+    return labels, sizes, (nodes if intern else None)
+
+def main():
+    print("=== Streaming components over a labelled edge stream ===")
+    g = sample_symmetric_graph()
+    labels, sizes, nodes = stream_components(((u, v) for u, v, _ in g.edges()), intern=True)
+    print(dict(zip(nodes, labels.tolist())), sizes.tolist())
+
+    print("=== Components from id chunks ===")
+    labels, sizes, _ = stream_components([([0, 1], [1, 2]), ([5], [6])], chunked=True)
+    print(labels.tolist(), sizes.tolist())
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
 from __future__ import annotations
-from typing import Any, List, Optional, Iterable, Tuple, Union
+from bisect import bisect_left, bisect_right
+from typing import Any, List, Optional, Iterable, Iterator, Tuple, Union
 
 class BPlusLeaf:
     def __init__(self) -> None:
         self.keys: List[Any] = []
         self.values: List[Any] = []
         self.next: Optional["BPlusLeaf"] = None
+        self.prev: Optional["BPlusLeaf"] = None
 
 class BPlusInternal:
     def __init__(self) -> None:
@@ -17,7 +19,8 @@ Node = Union[BPlusInternal, BPlusLeaf]
 class BPlusTree:
     """
     Simplified B+ Tree with insert/search/delete.
-    Values in leaves; internal nodes hold separators; leaves are linked.
+    Values in leaves; internal nodes hold separators; leaves are doubly linked,
+    so range scans and cursors descend once and then walk the leaf chain.
     """
     def __init__(self, order: int = 4) -> None:
         if order < 3:
@@ -37,6 +40,87 @@ class BPlusTree:
                 return node.values[i]
         return None
 
+    # -------- Ordered scans --------
+    def _find_leaf(self, key: Any) -> BPlusLeaf:
+        # The leaf key would live in: the only root-to-leaf descent a scan makes.
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def _edge_leaf(self, last: bool) -> BPlusLeaf:
+        node = self.root
+        while isinstance(node, BPlusInternal):
+            node = node.children[-1 if last else 0]
+        return node
+
+    def _scan(self, leaf: Optional[BPlusLeaf], i: int, hi: Any, hi_inclusive: bool) -> Iterator[Tuple[Any, Any]]:
+        # Ascending pairs from leaf.keys[i] on, stopping before the first key past hi (None = no bound).
+        cut = bisect_right if hi_inclusive else bisect_left
+        while leaf is not None:
+            keys = leaf.keys
+            if hi is not None and keys and (keys[-1] > hi or (keys[-1] == hi and not hi_inclusive)):
+                j = cut(keys, hi, i)
+                yield from zip(keys[i:j], leaf.values[i:j])
+                return
+            yield from zip(keys[i:], leaf.values[i:])
+            leaf, i = leaf.next, 0
+
+    def _scan_reverse(self, leaf: Optional[BPlusLeaf], j: int, lo: Any, lo_inclusive: bool) -> Iterator[Tuple[Any, Any]]:
+        # Descending pairs from leaf.keys[j - 1] down, stopping at the first key before lo.
+        cut = bisect_left if lo_inclusive else bisect_right
+        while leaf is not None:
+            keys, values = leaf.keys, leaf.values
+            i = cut(keys, lo, 0, j) if lo is not None and keys and (keys[0] < lo or (keys[0] == lo and not lo_inclusive)) else 0
+            for k in range(j - 1, i - 1, -1):
+                yield keys[k], values[k]
+            if i > 0:
+                return
+            leaf = leaf.prev
+            j = len(leaf.keys) if leaf is not None else 0
+
+    def range(self, lo: Any = None, hi: Any = None, inclusive: Union[bool, Tuple[bool, bool]] = (True, True),
+              reverse: bool = False) -> Iterator[Tuple[Any, Any]]:
+        """
+        (key, value) pairs with lo <= key <= hi in key order (descending if reverse).
+        inclusive is one flag for both ends or a (lo, hi) pair; None leaves a side open.
+        """
+        lo_inc, hi_inc = (inclusive, inclusive) if isinstance(inclusive, bool) else inclusive
+        if not reverse:
+            if lo is None:
+                return self._scan(self._edge_leaf(False), 0, hi, hi_inc)
+            leaf = self._find_leaf(lo)
+            i = (bisect_left if lo_inc else bisect_right)(leaf.keys, lo)
+            return self._scan(leaf, i, hi, hi_inc)
+        if hi is None:
+            leaf = self._edge_leaf(True)
+            return self._scan_reverse(leaf, len(leaf.keys), lo, lo_inc)
+        leaf = self._find_leaf(hi)
+        j = (bisect_right if hi_inc else bisect_left)(leaf.keys, hi)
+        return self._scan_reverse(leaf, j, lo, lo_inc)
+
+    def items_from(self, key: Any) -> Iterator[Tuple[Any, Any]]:
+        """(key, value) pairs from the first key >= key to the end of the tree."""
+        return self.range(key, None)
+
+    def items(self, reverse: bool = False) -> Iterator[Tuple[Any, Any]]:
+        return self.range(reverse=reverse)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (k for k, _ in self.range())
+
+    def __reversed__(self) -> Iterator[Any]:
+        return (k for k, _ in self.range(reverse=True))
+
+    def cursor(self, key: Any = None) -> "BPlusCursor":
+        """Cursor on the first key >= key (the smallest key when key is None)."""
+        c = BPlusCursor(self)
+        if key is None:
+            c.first()
+        else:
+            c.seek(key)
+        return c
+
     def insert(self, key: Any, value: Any = None) -> None:
         value = key if value is None else value
         root = self.root
@@ -81,6 +165,9 @@ class BPlusTree:
         leaf.keys = leaf.keys[:mid]
         leaf.values = leaf.values[:mid]
         right.next = leaf.next
+        right.prev = leaf
+        if leaf.next is not None:
+            leaf.next.prev = right
         leaf.next = right
         return right.keys[0], right
 
@@ -105,9 +192,7 @@ class BPlusTree:
 
     def _delete_recursive(self, parent: Optional[BPlusInternal], node: Node, key: Any, child_index: Optional[int]):
         if isinstance(node, BPlusLeaf):
-            changed = self._leaf_delete(node, key)
-            if changed and parent is not None:
-                self._rebalance_after_delete(parent, child_index)
+            self._leaf_delete(node, key)  # the caller rebalances this leaf under its parent
             return
         i = 0
         while i < len(node.keys) and key >= node.keys[i]:
@@ -169,6 +254,8 @@ class BPlusTree:
         if isinstance(left, BPlusLeaf) and isinstance(right, BPlusLeaf):
             left.keys.extend(right.keys); left.values.extend(right.values)
             left.next = right.next
+            if right.next is not None:
+                right.next.prev = left
             parent.keys.pop(idx); parent.children.pop(idx+1)
         elif isinstance(left, BPlusInternal) and isinstance(right, BPlusInternal):
             sep = parent.keys.pop(idx)
@@ -182,11 +269,89 @@ class BPlusTree:
             self.insert(x)
         return self
 
+class BPlusCursor:
+    """
+    Position in a BPlusTree's leaf chain. seek() descends from the root once; next() and
+    prev() then step along the leaves. Inserting or deleting invalidates the cursor
+    until the next seek()/first()/last().
+    """
+    def __init__(self, tree: BPlusTree) -> None:
+        self.tree = tree
+        self._leaf: Optional[BPlusLeaf] = None
+        self._i = 0
+
+    def _settle_forward(self) -> bool:
+        # Skips leaves that are exhausted (or empty) going right.
+        while self._leaf is not None and self._i >= len(self._leaf.keys):
+            self._leaf, self._i = self._leaf.next, 0
+        return self._leaf is not None
+
+    def _settle_backward(self) -> bool:
+        while self._leaf is not None and self._i < 0:
+            self._leaf = self._leaf.prev
+            self._i = len(self._leaf.keys) - 1 if self._leaf is not None else 0
+        return self._leaf is not None
+
+    def seek(self, key: Any) -> bool:
+        """Moves to the first key >= key; False (and invalid) if there is none."""
+        self._leaf = self.tree._find_leaf(key)
+        self._i = bisect_left(self._leaf.keys, key)
+        return self._settle_forward()
+
+    def first(self) -> bool:
+        self._leaf, self._i = self.tree._edge_leaf(False), 0
+        return self._settle_forward()
+
+    def last(self) -> bool:
+        self._leaf = self.tree._edge_leaf(True)
+        self._i = len(self._leaf.keys) - 1
+        return self._settle_backward()
+
+    def next(self) -> bool:
+        if self._leaf is None:
+            return False
+        self._i += 1
+        return self._settle_forward()
+
+    def prev(self) -> bool:
+        if self._leaf is None:
+            return False
+        self._i -= 1
+        return self._settle_backward()
+
+    @property
+    def valid(self) -> bool:
+        return self._leaf is not None
+
+    @property
+    def key(self) -> Any:
+        if self._leaf is None:
+            raise IndexError("cursor is not on a key")
+        return self._leaf.keys[self._i]
+
+    @property
+    def value(self) -> Any:
+        if self._leaf is None:
+            raise IndexError("cursor is not on a key")
+        return self._leaf.values[self._i]
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        """Streams (key, value) pairs from the current position onward, moving the cursor."""
+        while self._leaf is not None:
+            yield self._leaf.keys[self._i], self._leaf.values[self._i]
+            self.next()
+
 def main() -> None:
     bpt = BPlusTree(order=3).build_from([10,20,5,6,12,30,7,17])
     print("B+ search 12:", bpt.search(12))
     bpt.delete(12); print("B+ delete 12, search:", bpt.search(12))
     bpt.delete(5); print("B+ delete 5, search:", bpt.search(5))
+    print("B+ range [6, 20):", list(bpt.range(6, 20, inclusive=(True, False))))
+    print("B+ items from 15:", list(bpt.items_from(15)), "reversed keys:", list(reversed(bpt)))
+    cur = bpt.cursor(8)
+    print("B+ cursor at 8 ->", cur.key, end="")
+    cur.next(); print(", next", cur.key, end="")
+    cur.prev(); cur.prev(); print(", prev x2", cur.key)
 
 if __name__ == "__main__":
     main()